@@ -21,7 +21,7 @@ from python.agents.turn_predictor.turn_predictor_prompt_builder import (
 from python.game.environment.battle_stream_store import BattleStreamStore
 from python.game.environment.state_transition import StateTransition
 from python.game.events.battle_event import BattleEvent, RequestEvent, TurnEvent
-from python.game.protocol.message_parser import MessageParser
+from python.game.protocol.message_parser import parse_message
 from python.game.schema.battle_state import BattleState
 from python.agents.turn_predictor.turn_predictor_state import TurnPredictorState
 
@@ -91,7 +91,6 @@ def _collect_states(
     past_turns: int,
 ) -> List[Tuple[int, TurnPredictorState]]:
     """Replay events and collect TurnPredictorStates for selected turns."""
-    parser = MessageParser()
     store = BattleStreamStore()
     prompt_builder = TurnPredictorPromptBuilder(battle_stream_store=store)
     battle_state = BattleState()
@@ -100,7 +99,7 @@ def _collect_states(
     results: List[Tuple[int, TurnPredictorState]] = []
 
     for raw_event in events:
-        battle_event: BattleEvent = parser.parse(raw_event)
+        battle_event: BattleEvent = parse_message(raw_event)
         store.add_events([battle_event])
         battle_state = StateTransition.apply(battle_state, battle_event)
 
@@ -6,7 +6,7 @@ handles challenges, and runs battles using the specified agent.
 
 import asyncio
 import time
-from typing import List
+from typing import List, Optional
 
 from absl import app, flags, logging
 
@@ -115,6 +115,9 @@ async def run_battle() -> None:
     username = FLAGS.username or generate_default_username(FLAGS.agent)
     client = ShowdownClient()
     stats_tracker = OpponentStatsTracker()
+    # Kept outside the loop so the finally below can flush the current
+    # battle's log when the battle ends with an exception
+    logger: Optional[BattleEventLogger] = None
 
     try:
         await client.connect(FLAGS.server_url, username, FLAGS.password)
@@ -275,6 +278,8 @@ async def run_battle() -> None:
     except Exception as e:
         logging.error(f"Error during battle: {e}", exc_info=True)
     finally:
+        if logger:
+            logger.close()
         await client.disconnect()
         logging.info("Disconnected from server")
 
@@ -1,18 +1,50 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from enum import IntEnum
+from typing import ClassVar, Optional, Tuple
+
+
+def _parse_ident(ident: str) -> Tuple[str, str, str]:
+    """Split a Pokemon identifier like "p1a: Pikachu" into its parts.
+
+    Returns:
+        Tuple of (player_id, position, pokemon_name). pokemon_name is empty
+        when the identifier has no ": " separator.
+    """
+    slot, _, pokemon_name = ident.partition(": ")
+    return slot[:2], slot[2:], pokemon_name
+
+
+class EventKind(IntEnum):
+    """Tags the events that stream consumers branch on, so they can compare
+    an int instead of running isinstance checks."""
+
+    OTHER = 0
+    TURN = 1
+    ERROR = 2
+    REQUEST = 3
+    BATTLE_END = 4
 
 
 class BattleEvent(ABC):
+    __slots__ = ()
+
+    kind: ClassVar[EventKind] = EventKind.OTHER
+    # Declared by every concrete event dataclass; no default here, so it does
+    # not become a base field and subclass field order is unchanged
+    raw_message: str
+
     @classmethod
     @abstractmethod
     def parse_raw_message(cls, raw_message: str) -> "BattleEvent":
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TurnEvent(BattleEvent):
+    kind: ClassVar[EventKind] = EventKind.TURN
+
     raw_message: str
     turn_number: int
     timestamp: Optional[datetime] = None
@@ -21,21 +53,23 @@ class TurnEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "TurnEvent":
         parts = raw_message.split("|")
         turn_number = int(parts[2])
-        return cls(raw_message=raw_message, turn_number=turn_number)
+        return cls(raw_message, turn_number)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BattleStartEvent(BattleEvent):
     raw_message: str
     timestamp: Optional[datetime] = None
 
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "BattleStartEvent":
-        return cls(raw_message=raw_message)
+        return cls(raw_message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BattleEndEvent(BattleEvent):
+    kind: ClassVar[EventKind] = EventKind.BATTLE_END
+
     raw_message: str
     winner: str
     timestamp: Optional[datetime] = None
@@ -44,10 +78,10 @@ class BattleEndEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "BattleEndEvent":
         parts = raw_message.split("|")
         winner = parts[2]
-        return cls(raw_message=raw_message, winner=winner)
+        return cls(raw_message, winner)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayerEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -64,16 +98,10 @@ class PlayerEvent(BattleEvent):
         avatar = parts[4] if len(parts) > 4 else ""
         rating = int(parts[5]) if len(parts) > 5 and parts[5] else None
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            username=username,
-            avatar=avatar,
-            rating=rating,
-        )
+        return cls(raw_message, player_id, username, avatar, rating)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamSizeEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -85,10 +113,10 @@ class TeamSizeEvent(BattleEvent):
         parts = raw_message.split("|")
         player_id = parts[2]
         size = int(parts[3])
-        return cls(raw_message=raw_message, player_id=player_id, size=size)
+        return cls(raw_message, player_id, size)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenEvent(BattleEvent):
     raw_message: str
     generation: int
@@ -98,10 +126,10 @@ class GenEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "GenEvent":
         parts = raw_message.split("|")
         generation = int(parts[2])
-        return cls(raw_message=raw_message, generation=generation)
+        return cls(raw_message, generation)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TierEvent(BattleEvent):
     raw_message: str
     tier: str
@@ -111,10 +139,10 @@ class TierEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "TierEvent":
         parts = raw_message.split("|")
         tier = parts[2]
-        return cls(raw_message=raw_message, tier=tier)
+        return cls(raw_message, tier)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameTypeEvent(BattleEvent):
     raw_message: str
     game_type: str
@@ -124,10 +152,10 @@ class GameTypeEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "GameTypeEvent":
         parts = raw_message.split("|")
         game_type = parts[2]
-        return cls(raw_message=raw_message, game_type=game_type)
+        return cls(raw_message, game_type)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwitchEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -145,10 +173,7 @@ class SwitchEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "SwitchEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         details_parts = parts[3].split(", ")
         species = details_parts[0]
@@ -181,21 +206,21 @@ class SwitchEvent(BattleEvent):
         )
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            species=species,
-            level=level,
-            gender=gender,
-            shiny=shiny,
-            hp_current=hp_current,
-            hp_max=hp_max,
-            status=status,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            species,
+            level,
+            gender,
+            shiny,
+            hp_current,
+            hp_max,
+            status,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DragEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -213,10 +238,7 @@ class DragEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "DragEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         details_parts = parts[3].split(", ")
         species = details_parts[0]
@@ -249,21 +271,21 @@ class DragEvent(BattleEvent):
         )
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            species=species,
-            level=level,
-            gender=gender,
-            shiny=shiny,
-            hp_current=hp_current,
-            hp_max=hp_max,
-            status=status,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            species,
+            level,
+            gender,
+            shiny,
+            hp_current,
+            hp_max,
+            status,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DamageEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -279,10 +301,7 @@ class DamageEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "DamageEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         hp_string = parts[3]
         if "fnt" in hp_string and "/" not in hp_string:
@@ -312,22 +331,22 @@ class DamageEvent(BattleEvent):
             elif parts[i].startswith("[of]"):
                 of_ident = parts[i][4:] if len(parts[i]) > 4 else ""
                 if ": " in of_ident:
-                    source_pokemon = of_ident.split(": ")[1]
+                    source_pokemon = of_ident.partition(": ")[2]
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            hp_current=hp_current,
-            hp_max=hp_max,
-            status=status,
-            source=source,
-            source_pokemon=source_pokemon,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            hp_current,
+            hp_max,
+            status,
+            source,
+            source_pokemon,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -342,10 +361,7 @@ class HealEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "HealEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         hp_parts = parts[3].split("/")
         hp_status_parts = hp_parts[1].split(" ") if len(hp_parts) > 1 else ["100", ""]
@@ -363,18 +379,18 @@ class HealEvent(BattleEvent):
                 source = parts[i][6:] if len(parts[i]) > 6 else None
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            hp_current=hp_current,
-            hp_max=hp_max,
-            status=status,
-            source=source,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            hp_current,
+            hp_max,
+            status,
+            source,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FaintEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -385,20 +401,12 @@ class FaintEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "FaintEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -411,10 +419,7 @@ class StatusEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "StatusEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         status = parts[3]
 
@@ -423,17 +428,10 @@ class StatusEvent(BattleEvent):
             if parts[i].startswith("[from]"):
                 source = parts[i][6:] if len(parts[i]) > 6 else None
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            status=status,
-            source=source,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, status, source)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CureStatusEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -445,23 +443,14 @@ class CureStatusEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "CureStatusEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         status = parts[3]
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            status=status,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, status)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MoveEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -479,10 +468,7 @@ class MoveEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "MoveEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         move_name = parts[3]
 
@@ -490,10 +476,7 @@ class MoveEvent(BattleEvent):
         target_position = None
         target_name = None
         if len(parts) > 4 and parts[4] and not parts[4].startswith("["):
-            target_ident_parts = parts[4].split(": ")
-            target_player = target_ident_parts[0][:2]
-            target_position = target_ident_parts[0][2:]
-            target_name = target_ident_parts[1] if len(target_ident_parts) > 1 else ""
+            target_player, target_position, target_name = _parse_ident(parts[4])
 
         spread = False
         still = False
@@ -507,21 +490,21 @@ class MoveEvent(BattleEvent):
                 anim = parts[i][6:] if len(parts[i]) > 6 else None
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            move_name=move_name,
-            target_player=target_player,
-            target_position=target_position,
-            target_name=target_name,
-            spread=spread,
-            still=still,
-            anim=anim,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            move_name,
+            target_player,
+            target_position,
+            target_name,
+            spread,
+            still,
+            anim,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoostEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -534,25 +517,15 @@ class BoostEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "BoostEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         stat = parts[3]
         amount = int(parts[4])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            stat=stat,
-            amount=amount,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, stat, amount)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnboostEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -565,25 +538,15 @@ class UnboostEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "UnboostEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         stat = parts[3]
         amount = int(parts[4])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            stat=stat,
-            amount=amount,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, stat, amount)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetBoostEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -596,25 +559,15 @@ class SetBoostEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "SetBoostEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         stat = parts[3]
         stage = int(parts[4])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            stat=stat,
-            stage=stage,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, stat, stage)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClearBoostEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -625,30 +578,22 @@ class ClearBoostEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ClearBoostEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClearAllBoostEvent(BattleEvent):
     raw_message: str
     timestamp: Optional[datetime] = None
 
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ClearAllBoostEvent":
-        return cls(raw_message=raw_message)
+        return cls(raw_message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClearNegativeBoostEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -659,20 +604,12 @@ class ClearNegativeBoostEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ClearNegativeBoostEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AbilityEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -685,10 +622,7 @@ class AbilityEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "AbilityEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         ability = parts[3]
 
@@ -696,17 +630,10 @@ class AbilityEvent(BattleEvent):
         if len(parts) > 4 and parts[4] and not parts[4].startswith("["):
             trigger = parts[4]
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            ability=ability,
-            trigger=trigger,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, ability, trigger)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EndAbilityEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -718,23 +645,14 @@ class EndAbilityEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "EndAbilityEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         ability = parts[3]
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            ability=ability,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, ability)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ItemEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -747,10 +665,7 @@ class ItemEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ItemEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         item = parts[3]
 
@@ -758,17 +673,10 @@ class ItemEvent(BattleEvent):
         if len(parts) > 4 and parts[4] and not parts[4].startswith("["):
             trigger = parts[4]
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            item=item,
-            trigger=trigger,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, item, trigger)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EndItemEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -781,10 +689,7 @@ class EndItemEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "EndItemEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         item = parts[3]
 
@@ -793,17 +698,10 @@ class EndItemEvent(BattleEvent):
             if parts[i].startswith("[from]"):
                 reason = parts[i][6:] if len(parts[i]) > 6 else None
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            item=item,
-            reason=reason,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, item, reason)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartVolatileEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -816,10 +714,7 @@ class StartVolatileEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "StartVolatileEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         condition = parts[3]
 
@@ -828,17 +723,10 @@ class StartVolatileEvent(BattleEvent):
             if parts[i] == "[silent]":
                 silent = True
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            condition=condition,
-            silent=silent,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, condition, silent)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EndVolatileEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -851,10 +739,7 @@ class EndVolatileEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "EndVolatileEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         condition = parts[3]
 
@@ -863,17 +748,10 @@ class EndVolatileEvent(BattleEvent):
             if parts[i] == "[silent]":
                 silent = True
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            condition=condition,
-            silent=silent,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, condition, silent)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SingleTurnEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -885,23 +763,14 @@ class SingleTurnEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "SingleTurnEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         effect = parts[3]
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            effect=effect,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, effect)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SingleMoveEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -913,23 +782,14 @@ class SingleMoveEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "SingleMoveEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         effect = parts[3]
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            effect=effect,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, effect)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeatherEvent(BattleEvent):
     raw_message: str
     weather: str
@@ -946,14 +806,10 @@ class WeatherEvent(BattleEvent):
             if parts[i] == "[upkeep]":
                 upkeep = True
 
-        return cls(
-            raw_message=raw_message,
-            weather=weather,
-            upkeep=upkeep,
-        )
+        return cls(raw_message, weather, upkeep)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldStartEvent(BattleEvent):
     raw_message: str
     effect: str
@@ -963,10 +819,10 @@ class FieldStartEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "FieldStartEvent":
         parts = raw_message.split("|")
         effect = parts[2]
-        return cls(raw_message=raw_message, effect=effect)
+        return cls(raw_message, effect)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldEndEvent(BattleEvent):
     raw_message: str
     effect: str
@@ -976,10 +832,10 @@ class FieldEndEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "FieldEndEvent":
         parts = raw_message.split("|")
         effect = parts[2]
-        return cls(raw_message=raw_message, effect=effect)
+        return cls(raw_message, effect)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SideStartEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -995,15 +851,10 @@ class SideStartEvent(BattleEvent):
 
         layers = None
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            condition=condition,
-            layers=layers,
-        )
+        return cls(raw_message, player_id, condition, layers)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SideEndEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1022,15 +873,10 @@ class SideEndEvent(BattleEvent):
             if parts[i].startswith("[from]"):
                 source = parts[i][6:] if len(parts[i]) > 6 else None
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            condition=condition,
-            source=source,
-        )
+        return cls(raw_message, player_id, condition, source)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TerastallizeEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1042,23 +888,14 @@ class TerastallizeEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "TerastallizeEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         tera_type = parts[3]
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            tera_type=tera_type,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, tera_type)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FormeChangeEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1073,10 +910,7 @@ class FormeChangeEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "FormeChangeEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         new_species = parts[3]
 
@@ -1091,18 +925,18 @@ class FormeChangeEvent(BattleEvent):
         )
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            new_species=new_species,
-            hp_current=hp_current,
-            hp_max=hp_max,
-            status=status,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            new_species,
+            hp_current,
+            hp_max,
+            status,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransformEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1116,28 +950,22 @@ class TransformEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "TransformEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        target_ident_parts = parts[3].split(": ")
-        target_player = target_ident_parts[0][:2]
-        target_position = target_ident_parts[0][2:]
-        target_name = target_ident_parts[1] if len(target_ident_parts) > 1 else ""
+        target_player, target_position, target_name = _parse_ident(parts[3])
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            target_player=target_player,
-            target_position=target_position,
-            target_name=target_name,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            target_player,
+            target_position,
+            target_name,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivateEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1150,10 +978,7 @@ class ActivateEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ActivateEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         effect = parts[3]
 
@@ -1162,17 +987,10 @@ class ActivateEvent(BattleEvent):
             if parts[i].startswith("[from]"):
                 source = parts[i][6:] if len(parts[i]) > 6 else None
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            effect=effect,
-            source=source,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, effect, source)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrepareEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1187,10 +1005,7 @@ class PrepareEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "PrepareEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         move_name = parts[3]
 
@@ -1198,24 +1013,21 @@ class PrepareEvent(BattleEvent):
         target_position = None
         target_name = None
         if len(parts) > 4 and parts[4] and not parts[4].startswith("["):
-            target_ident_parts = parts[4].split(": ")
-            target_player = target_ident_parts[0][:2]
-            target_position = target_ident_parts[0][2:]
-            target_name = target_ident_parts[1] if len(target_ident_parts) > 1 else ""
+            target_player, target_position, target_name = _parse_ident(parts[4])
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            move_name=move_name,
-            target_player=target_player,
-            target_position=target_position,
-            target_name=target_name,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            move_name,
+            target_player,
+            target_position,
+            target_name,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CantEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1228,10 +1040,7 @@ class CantEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "CantEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         reason = parts[3]
         move_name = (
@@ -1240,17 +1049,10 @@ class CantEvent(BattleEvent):
             else None
         )
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            reason=reason,
-            move_name=move_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, reason, move_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SuperEffectiveEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1261,20 +1063,12 @@ class SuperEffectiveEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "SuperEffectiveEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResistedEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1285,20 +1079,12 @@ class ResistedEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ResistedEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImmuneEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1309,20 +1095,12 @@ class ImmuneEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ImmuneEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CritEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1333,20 +1111,12 @@ class CritEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "CritEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MissEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1357,20 +1127,12 @@ class MissEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "MissEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1381,20 +1143,12 @@ class FailEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "FailEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-        )
+        return cls(raw_message, player_id, position, pokemon_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HitCountEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1406,23 +1160,14 @@ class HitCountEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "HitCountEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         count = int(parts[3])
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            count=count,
-        )
+        return cls(raw_message, player_id, position, pokemon_name, count)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetHpEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1436,10 +1181,7 @@ class SetHpEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "SetHpEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         hp_parts = parts[3].split("/")
         hp_status_parts = hp_parts[1].split(" ") if len(hp_parts) > 1 else ["100", ""]
@@ -1452,17 +1194,11 @@ class SetHpEvent(BattleEvent):
         )
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            hp_current=hp_current,
-            hp_max=hp_max,
-            status=status,
+            raw_message, player_id, position, pokemon_name, hp_current, hp_max, status
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReplaceEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1480,10 +1216,7 @@ class ReplaceEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ReplaceEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         details_parts = parts[3].split(", ")
         species = details_parts[0]
@@ -1523,21 +1256,21 @@ class ReplaceEvent(BattleEvent):
             status = None
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            species=species,
-            level=level,
-            gender=gender,
-            shiny=shiny,
-            hp_current=hp_current,
-            hp_max=hp_max,
-            status=status,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            species,
+            level,
+            gender,
+            shiny,
+            hp_current,
+            hp_max,
+            status,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DetailsChangeEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1552,10 +1285,7 @@ class DetailsChangeEvent(BattleEvent):
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "DetailsChangeEvent":
         parts = raw_message.split("|")
-        ident_parts = parts[2].split(": ")
-        player_id = ident_parts[0][:2]
-        position = ident_parts[0][2:]
-        pokemon_name = ident_parts[1] if len(ident_parts) > 1 else ""
+        player_id, position, pokemon_name = _parse_ident(parts[2])
 
         new_details = parts[3]
 
@@ -1585,18 +1315,18 @@ class DetailsChangeEvent(BattleEvent):
             status = None
 
         return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            position=position,
-            pokemon_name=pokemon_name,
-            new_details=new_details,
-            hp_current=hp_current,
-            hp_max=hp_max,
-            status=status,
+            raw_message,
+            player_id,
+            position,
+            pokemon_name,
+            new_details,
+            hp_current,
+            hp_max,
+            status,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PokeEvent(BattleEvent):
     raw_message: str
     player_id: str
@@ -1626,48 +1356,43 @@ class PokeEvent(BattleEvent):
         if len(parts) > 4 and parts[4]:
             item = parts[4]
 
-        return cls(
-            raw_message=raw_message,
-            player_id=player_id,
-            species=species,
-            gender=gender,
-            shiny=shiny,
-            item=item,
-        )
+        return cls(raw_message, player_id, species, gender, shiny, item)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClearPokeEvent(BattleEvent):
     raw_message: str
     timestamp: Optional[datetime] = None
 
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "ClearPokeEvent":
-        return cls(raw_message=raw_message)
+        return cls(raw_message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamPreviewEvent(BattleEvent):
     raw_message: str
     timestamp: Optional[datetime] = None
 
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "TeamPreviewEvent":
-        return cls(raw_message=raw_message)
+        return cls(raw_message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpkeepEvent(BattleEvent):
     raw_message: str
     timestamp: Optional[datetime] = None
 
     @classmethod
     def parse_raw_message(cls, raw_message: str) -> "UpkeepEvent":
-        return cls(raw_message=raw_message)
+        return cls(raw_message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequestEvent(BattleEvent):
+    kind: ClassVar[EventKind] = EventKind.REQUEST
+
     raw_message: str
     request_json: str
     timestamp: Optional[datetime] = None
@@ -1676,10 +1401,10 @@ class RequestEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "RequestEvent":
         parts = raw_message.split("|")
         request_json = parts[2] if len(parts) > 2 else "{}"
-        return cls(raw_message=raw_message, request_json=request_json)
+        return cls(raw_message, request_json)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrivateMessageEvent(BattleEvent):
     raw_message: str
     sender: str
@@ -1693,15 +1418,10 @@ class PrivateMessageEvent(BattleEvent):
         sender = parts[2] if len(parts) > 2 else ""
         recipient = parts[3] if len(parts) > 3 else ""
         message = parts[4] if len(parts) > 4 else ""
-        return cls(
-            raw_message=raw_message,
-            sender=sender,
-            recipient=recipient,
-            message=message,
-        )
+        return cls(raw_message, sender, recipient, message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateSearchEvent(BattleEvent):
     """Event for ladder search status updates."""
 
@@ -1713,10 +1433,10 @@ class UpdateSearchEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "UpdateSearchEvent":
         parts = raw_message.split("|")
         search_json = parts[2] if len(parts) > 2 else "{}"
-        return cls(raw_message=raw_message, search_json=search_json)
+        return cls(raw_message, search_json)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PopupEvent(BattleEvent):
     """Event for popup messages from the server (usually errors or notifications)."""
 
@@ -1729,13 +1449,15 @@ class PopupEvent(BattleEvent):
         parts = raw_message.split("|")
         # Join all parts after |popup| to get the full message including newlines
         popup_text = "|".join(parts[2:]) if len(parts) > 2 else ""
-        return cls(raw_message=raw_message, popup_text=popup_text)
+        return cls(raw_message, popup_text)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorEvent(BattleEvent):
     """Event for error messages from the server."""
 
+    kind: ClassVar[EventKind] = EventKind.ERROR
+
     raw_message: str
     error_text: str
     timestamp: Optional[datetime] = None
@@ -1745,10 +1467,10 @@ class ErrorEvent(BattleEvent):
         parts = raw_message.split("|")
         # Join all parts after |error| to get the full error message
         error_text = "|".join(parts[2:]) if len(parts) > 2 else ""
-        return cls(raw_message=raw_message, error_text=error_text)
+        return cls(raw_message, error_text)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnknownEvent(BattleEvent):
     raw_message: str
     message_type: Optional[str] = None
@@ -1758,10 +1480,10 @@ class UnknownEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "UnknownEvent":
         parts = raw_message.split("|")
         message_type = parts[1] if len(parts) > 1 else None
-        return cls(raw_message=raw_message, message_type=message_type)
+        return cls(raw_message, message_type)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IgnoredEvent(BattleEvent):
     """Event for known message types that are metadata/UI and can be ignored."""
 
@@ -1773,4 +1495,4 @@ class IgnoredEvent(BattleEvent):
     def parse_raw_message(cls, raw_message: str) -> "IgnoredEvent":
         parts = raw_message.split("|")
         message_type = parts[1] if len(parts) > 1 else None
-        return cls(raw_message=raw_message, message_type=message_type)
+        return cls(raw_message, message_type)
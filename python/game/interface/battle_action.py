@@ -1,14 +1,39 @@
 """Battle action representation for agent decisions."""
 
+import functools
+import sys
 from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
+from enum import StrEnum
+from typing import Callable, Dict, Optional, Tuple
 
 from python.game.schema.object_name_normalizer import normalize_name
 
 
-class ActionType(Enum):
-    """Type of action an agent can take."""
+# Showdown target specs indexed by target_index: 0->+1, 1->+2, 2->-1, 3->-2
+_TARGET_SPECS = ("+1", "+2", "-1", "-2")
+_MEGA_SUFFIX = " mega"
+_TERA_SUFFIX = " terastallize"
+
+# Every move command suffix, precomputed for each (target_index, mega, tera)
+# combination so building a move command is a lookup plus one concatenation.
+_MOVE_SUFFIXES: Dict[Tuple[Optional[int], bool, bool], str] = {
+    (target_index, mega, tera): (
+        (f" {_TARGET_SPECS[target_index]}" if target_index is not None else "")
+        + (_MEGA_SUFFIX if mega else "")
+        + (_TERA_SUFFIX if tera else "")
+    )
+    for target_index in (None, *range(len(_TARGET_SPECS)))
+    for mega in (False, True)
+    for tera in (False, True)
+}
+
+
+class ActionType(StrEnum):
+    """Type of action an agent can take.
+
+    A StrEnum so members hash and compare as plain strings, which keeps
+    command dispatch cheap while .value and JSON output stay unchanged.
+    """
 
     MOVE = "move"
     SWITCH = "switch"
@@ -17,7 +42,7 @@ class ActionType(Enum):
     UNKNOWN_SWITCH = "unknown_switch"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BattleAction:
     """Immutable representation of an agent's battle decision.
 
@@ -99,54 +124,66 @@ class BattleAction:
             >>> BattleAction(ActionType.SWITCH, switch_pokemon_name="pikachu").to_showdown_command()
             '/choose switch pikachu'
         """
-        if self.action_type == ActionType.MOVE:
-            if self.move_name is None:
-                raise ValueError("MOVE action requires move_name")
-
-            # Normalize move name for Showdown protocol (lowercase, no spaces/hyphens)
-            normalized_move = normalize_name(self.move_name)
-            command = f"/choose move {normalized_move}"
-
-            # Add target index if specified (doubles)
-            # Protocol uses +/- prefix: +1,+2 for opponents, -1,-2 for allies
-            # target_index mapping: 0->+1, 1->+2, 2->-1, 3->-2
-            if self.target_index is not None:
-                if self.target_index <= 1:
-                    # Opponent targeting (most common)
-                    target_spec = f"+{self.target_index + 1}"
-                else:
-                    # Ally targeting (for support moves)
-                    target_spec = f"-{self.target_index - 1}"
-                command = f"{command} {target_spec}"
-
-            # Add mega/tera flags
-            # Protocol: "mega" for Mega Evolution, "max" for Dynamax, "terastallize" for Terastallization
-            if self.mega:
-                command = f"{command} mega"
-            if self.tera:
-                command = f"{command} terastallize"
-
-            return command
-
-        elif self.action_type == ActionType.SWITCH:
-            if self.switch_pokemon_name is None:
-                raise ValueError("SWITCH action requires switch_pokemon_name")
-
-            # Normalize Pokemon name for Showdown protocol (lowercase, no spaces/hyphens)
-            normalized_pokemon = normalize_name(self.switch_pokemon_name)
-            return f"/choose switch {normalized_pokemon}"
-
-        elif self.action_type == ActionType.TEAM_ORDER:
-            if self.team_order is None:
-                raise ValueError("TEAM_ORDER action requires team_order")
-
-            return f"/choose team {self.team_order}"
-
-        elif self.action_type in (ActionType.UNKNOWN_MOVE, ActionType.UNKNOWN_SWITCH):
-            raise ValueError(
-                f"Cannot convert {self.action_type.value} to Showdown command. "
-                "Unknown actions are placeholders for opponent move inference only."
-            )
-
-        else:
-            raise ValueError(f"Unknown action type: {self.action_type}")
+        # Fields are frozen, so commands are memoized per distinct action.
+        # Builders that raise leave nothing cached, so errors re-raise each call.
+        return _build_command(self)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_command(action: BattleAction) -> str:
+    """Build the command for an action, shared across equal BattleActions.
+
+    Agents recreate the same few actions (move slots, team switches) every
+    turn, so equal actions reuse one interned command string.
+    """
+    try:
+        builder = _COMMAND_BUILDERS[action.action_type]
+    except KeyError:
+        raise ValueError(f"Unknown action type: {action.action_type}") from None
+    return sys.intern(builder(action))
+
+
+def _build_move_command(action: BattleAction) -> str:
+    if action.move_name is None:
+        raise ValueError("MOVE action requires move_name")
+
+    # Target index (doubles) uses +/- prefix: +1,+2 for opponents, -1,-2 for
+    # allies. Protocol: "mega" for Mega Evolution, "terastallize" for
+    # Terastallization.
+    suffix = _MOVE_SUFFIXES.get((action.target_index, action.mega, action.tera))
+    if suffix is None:
+        raise ValueError(f"Invalid target_index: {action.target_index}")
+
+    # Normalize move name for Showdown protocol (lowercase, no spaces/hyphens)
+    return f"/choose move {normalize_name(action.move_name)}{suffix}"
+
+
+def _build_switch_command(action: BattleAction) -> str:
+    if action.switch_pokemon_name is None:
+        raise ValueError("SWITCH action requires switch_pokemon_name")
+
+    # Normalize Pokemon name for Showdown protocol (lowercase, no spaces/hyphens)
+    return f"/choose switch {normalize_name(action.switch_pokemon_name)}"
+
+
+def _build_team_command(action: BattleAction) -> str:
+    if action.team_order is None:
+        raise ValueError("TEAM_ORDER action requires team_order")
+
+    return f"/choose team {action.team_order}"
+
+
+def _raise_unknown(action: BattleAction) -> str:
+    raise ValueError(
+        f"Cannot convert {action.action_type.value} to Showdown command. "
+        "Unknown actions are placeholders for opponent move inference only."
+    )
+
+
+_COMMAND_BUILDERS: Dict[ActionType, Callable[[BattleAction], str]] = {
+    ActionType.MOVE: _build_move_command,
+    ActionType.SWITCH: _build_switch_command,
+    ActionType.TEAM_ORDER: _build_team_command,
+    ActionType.UNKNOWN_MOVE: _raise_unknown,
+    ActionType.UNKNOWN_SWITCH: _raise_unknown,
+}
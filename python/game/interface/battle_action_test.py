@@ -1,6 +1,7 @@
 """Unit tests for BattleAction."""
 
 import unittest
+from dataclasses import asdict
 
 from absl.testing import parameterized
 
@@ -135,6 +136,34 @@ class BattleActionTest(parameterized.TestCase):
         with self.assertRaises(Exception):
             action.move_name = "Flamethrower"  # type: ignore
 
+    def test_invalid_target_index_raises_error(self) -> None:
+        """Test that an out-of-range target_index raises error."""
+        action = BattleAction(
+            action_type=ActionType.MOVE, move_name="Surf", target_index=4
+        )
+        with self.assertRaises(ValueError) as context:
+            action.to_showdown_command()
+        self.assertIn("target_index", str(context.exception))
+
+    def test_command_is_cached_and_not_a_field(self) -> None:
+        """Test that the command is reused and not exposed via asdict()."""
+        action = BattleAction(
+            action_type=ActionType.MOVE, move_name="Earthquake", tera=True
+        )
+        command = action.to_showdown_command()
+        self.assertIs(action.to_showdown_command(), command)
+        self.assertNotIn("_command", asdict(action))
+
+    def test_equal_actions_share_command(self) -> None:
+        """Test that equal actions reuse the same command string."""
+        first = BattleAction(
+            action_type=ActionType.SWITCH, switch_pokemon_name="Pikachu"
+        )
+        second = BattleAction(
+            action_type=ActionType.SWITCH, switch_pokemon_name="Pikachu"
+        )
+        self.assertIs(first.to_showdown_command(), second.to_showdown_command())
+
     def test_action_type_enum_values(self) -> None:
         """Test ActionType enum has expected values."""
         self.assertEqual(ActionType.MOVE.value, "move")
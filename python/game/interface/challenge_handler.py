@@ -1,7 +1,9 @@
 """Challenge handler for accepting and sending Pokemon Showdown challenges."""
 
 import asyncio
-from typing import Any, Dict, Optional, Set
+import functools
+import re
+from typing import Any, Optional, Set
 
 from absl import logging
 
@@ -10,7 +12,16 @@ from python.game.events.battle_event import (
     PrivateMessageEvent,
     UpdateSearchEvent,
 )
-from python.game.protocol.message_parser import MessageParser
+
+# Line prefixes checked in listen_for_challenges. Frames arrive as text
+# already decoded by websockets, so these are str comparisons.
+_BATTLE_ROOM_PREFIX = ">battle-"
+_PM_PREFIX = "|pm|"
+_POPUP_PREFIX = "|popup|"
+_UPDATE_SEARCH_PREFIX = "|updatesearch|"
+_RANK_PREFIXES = "~+@#&"
+_CHALLENGE_PREFIX = "/challenge"
+_CHALLENGE_RE = re.compile(r"\s*/challenge\s+(\S+)")
 
 
 class ChallengeHandler:
@@ -38,8 +49,7 @@ class ChallengeHandler:
         self._opponent = opponent.lower() if opponent else None
         self._challenge_timeout = challenge_timeout
         self._team_data = team_data
-        self._parser = MessageParser()
-        self._pending_challenges: Dict[str, str] = {}
+        self._pending_challenges: Set[str] = set()
         self._accepted_battle: Optional[str] = None
         self._timeout_task: Optional[asyncio.Task[None]] = None
         self._joined_battle_rooms: Set[str] = set()
@@ -63,47 +73,62 @@ class ChallengeHandler:
         elif not self._opponent:
             await self.search_ladder()
 
+        client = self._client
+        receive_message = client.receive_message
+        joined_battle_rooms = self._joined_battle_rooms
+        # Truncating for debug output copies the string, so only do it when
+        # debug logging is enabled. Verbosity is fixed for the session.
+        debug_enabled = logging.level_debug()
+
         try:
-            while self._client.is_connected:
-                raw_message = await self._client.receive_message()
-                logging.debug("Received raw message: %s", raw_message[:200])
+            while client.is_connected:
+                raw_message = await receive_message()
+                if debug_enabled:
+                    logging.debug("Received raw message: %s", raw_message[:200])
 
                 if not raw_message.strip():
                     continue
 
+                # The protocol is "\n"-delimited only; splitlines() would also
+                # break on characters like U+2028 that users can put in a PM
                 for line in raw_message.split("\n"):
                     if not line.strip():
                         continue
 
-                    logging.debug("Processing line: %s", line[:100])
+                    if debug_enabled:
+                        logging.debug("Processing line: %s", line[:100])
 
                     # Check for battle room join
-                    if line.startswith(">battle-"):
+                    if line.startswith(_BATTLE_ROOM_PREFIX):
                         battle_room = line[1:].strip()
-                        if battle_room in self._joined_battle_rooms:
+                        if battle_room in joined_battle_rooms:
                             logging.debug(
                                 "Ignoring already joined battle room: %s", battle_room
                             )
                             continue
                         logging.info("Joined battle room: %s", battle_room)
-                        self._joined_battle_rooms.add(battle_room)
+                        joined_battle_rooms.add(battle_room)
                         self._accepted_battle = battle_room
                         if self._timeout_task:
                             self._timeout_task.cancel()
                         return self._accepted_battle
 
-                    event = self._parser.parse(line)
-
-                    if isinstance(event, PrivateMessageEvent):
+                    # Only PMs, popups and search updates matter here, so
+                    # classify by prefix and skip the full parser for the
+                    # chat/room traffic that makes up most lines.
+                    if line.startswith(_PM_PREFIX):
+                        event = PrivateMessageEvent.parse_raw_message(line)
                         logging.debug(
                             "Received PM from %s: %s", event.sender, event.message
                         )
                         await self._handle_pm(event)
-                    elif isinstance(event, PopupEvent):
-                        logging.warning("Server popup:\n%s", event.popup_text)
-                        logging.debug("Raw popup message: %s", event.raw_message)
-                    elif isinstance(event, UpdateSearchEvent):
-                        logging.debug("Ladder search update: %s", event.search_json)
+                    elif line.startswith(_POPUP_PREFIX):
+                        popup = PopupEvent.parse_raw_message(line)
+                        logging.warning("Server popup:\n%s", popup.popup_text)
+                        logging.debug("Raw popup message: %s", popup.raw_message)
+                    elif line.startswith(_UPDATE_SEARCH_PREFIX):
+                        search = UpdateSearchEvent.parse_raw_message(line)
+                        logging.debug("Ladder search update: %s", search.search_json)
 
         except asyncio.CancelledError:
             raise
@@ -124,6 +149,11 @@ class ChallengeHandler:
 
         challenger = self._normalize_username(event.sender)
         challenge_format = self._parse_challenge_format(event.message)
+        if not challenge_format:
+            logging.warning(
+                "Ignoring malformed challenge from %s: %r", challenger, event.message
+            )
+            return
 
         if challenge_format != self._format:
             logging.info(
@@ -137,14 +167,12 @@ class ChallengeHandler:
         if self._should_accept_challenge(challenger):
             logging.info("Accepting challenge from %s", challenger)
 
-            # Send team before accepting (as per Showdown protocol)
+            # Send team before accepting (as per Showdown protocol). The server
+            # handles a connection's commands in order, so no delay is needed.
             if self._team_data:
                 logging.info("Sending team before accepting challenge...")
                 await self._client.send_message(f"|/utm {self._team_data}")
 
-                # Give server a moment to process the team
-                await asyncio.sleep(0.1)
-
             await self.accept_challenge(challenger)
 
     def _is_challenge_message(self, message: str) -> bool:
@@ -156,7 +184,11 @@ class ChallengeHandler:
         Returns:
             True if message starts with '/challenge'
         """
-        return message.strip().startswith("/challenge")
+        # Fast path: PMs rarely carry leading whitespace, so avoid copying
+        # the message with lstrip() unless the direct prefix check misses.
+        if message.startswith(_CHALLENGE_PREFIX):
+            return True
+        return message.lstrip().startswith(_CHALLENGE_PREFIX)
 
     def _parse_challenge_format(self, message: str) -> str:
         """Parse the battle format from a challenge message.
@@ -165,14 +197,15 @@ class ChallengeHandler:
             message: Challenge message (e.g., '/challenge gen9ou')
 
         Returns:
-            Format string (e.g., 'gen9ou')
+            Format string (e.g., 'gen9ou'), or empty string if no format
+            follows '/challenge'
         """
-        parts = message.strip().split()
-        if len(parts) >= 2:
-            return parts[1].lower()
-        return ""
+        match = _CHALLENGE_RE.match(message)
+        return match.group(1).lower() if match else ""
 
-    def _normalize_username(self, username: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _normalize_username(username: str) -> str:
         """Normalize a username by removing rank prefix and lowercasing.
 
         Args:
@@ -182,7 +215,7 @@ class ChallengeHandler:
             Normalized lowercase username without rank prefix
         """
         username = username.strip()
-        if username and username[0] in "~+@#&":
+        if username and username[0] in _RANK_PREFIXES:
             username = username[1:]
         return username.lower()
 
@@ -207,7 +240,7 @@ class ChallengeHandler:
             username: Username of the challenger
         """
         await self._client.send_message(f"|/accept {username}")
-        self._pending_challenges[username] = username
+        self._pending_challenges.add(username)
         logging.info("Sent accept command for challenge from %s", username)
 
     async def send_challenge(self, username: str) -> None:
@@ -221,9 +254,6 @@ class ChallengeHandler:
             logging.info("Sending team before challenging...")
             await self._client.send_message(f"|/utm {self._team_data}")
 
-            # Give server a moment to process the team
-            await asyncio.sleep(0.1)
-
         await self._client.send_message(f"|/challenge {username}, {self._format}")
         logging.info("Sent challenge to %s with format %s", username, self._format)
 
@@ -235,7 +265,6 @@ class ChallengeHandler:
         if self._team_data:
             logging.info("Sending team before searching ladder...")
             await self._client.send_message(f"|/utm {self._team_data}")
-            await asyncio.sleep(0.1)
 
         await self._client.send_message(f"|/search {self._format}")
         logging.info("Joined ladder queue for format %s", self._format)
@@ -1,29 +1,43 @@
 """Tests for ChallengeHandler."""
 
 import asyncio
-import unittest
 from typing import List
+from unittest import mock
 
-from absl.testing import absltest, parameterized
+from absl.testing import absltest
 
+from python.game.interface import challenge_handler
 from python.game.interface.challenge_handler import ChallengeHandler
 
 
+# Queued after the scripted messages to mark the end of the stream. No
+# protocol message contains a NUL byte, so it cannot collide with one.
+_END_OF_MESSAGES = "\x00end-of-messages"
+
+
 class FakeShowdownClient:
     """Fake ShowdownClient for testing ChallengeHandler."""
 
-    def __init__(self, messages: List[str], message_delay: float = 0.0) -> None:
+    def __init__(self, messages: List[str], hold_until_sent: bool = False) -> None:
         """Initialize with a list of messages to return.
 
         Args:
             messages: List of raw protocol messages
-            message_delay: Optional delay in seconds before returning each message
+            hold_until_sent: If True, messages are only queued once something
+                has been sent, letting tests order sends before receives
         """
         self._messages = messages
-        self._index = 0
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
         self._sent_messages: List[str] = []
-        self._message_delay = message_delay
         self.is_connected = True
+        self._held = hold_until_sent
+        if not hold_until_sent:
+            self._enqueue_messages()
+
+    def _enqueue_messages(self) -> None:
+        for message in self._messages:
+            self._queue.put_nowait(message)
+        self._queue.put_nowait(_END_OF_MESSAGES)
 
     async def receive_message(self) -> str:
         """Return next message from the list.
@@ -34,15 +48,12 @@ class FakeShowdownClient:
         Raises:
             IndexError: If no more messages available
         """
-        if self._message_delay > 0:
-            await asyncio.sleep(self._message_delay)
-
-        if self._index >= len(self._messages):
+        message = await self._queue.get()
+        if message == _END_OF_MESSAGES:
+            # Leave the marker in place so later calls fail the same way
+            self._queue.put_nowait(message)
             self.is_connected = False
             raise IndexError("No more messages")
-
-        message = self._messages[self._index]
-        self._index += 1
         return message
 
     async def send_message(self, message: str) -> None:
@@ -51,6 +62,9 @@ class FakeShowdownClient:
         Args:
             message: Message to send
         """
+        if self._held:
+            self._held = False
+            self._enqueue_messages()
         self._sent_messages.append(message)
 
     def get_sent_messages(self) -> List[str]:
@@ -62,10 +76,27 @@ class FakeShowdownClient:
         return self._sent_messages
 
 
-class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestCase):
+class ChallengeHandlerTest(absltest.TestCase):
     """Tests for ChallengeHandler."""
 
-    async def test_accept_challenge_basic(self) -> None:
+    # One event loop for the whole class instead of a fresh loop per test
+    _runner: asyncio.Runner
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._runner = asyncio.Runner()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._runner.close()
+        super().tearDownClass()
+
+    def _listen(self, handler: ChallengeHandler) -> str:
+        """Run listen_for_challenges to completion on the shared loop."""
+        return self._runner.run(handler.listen_for_challenges())
+
+    def test_accept_challenge_basic(self) -> None:
         """Test accepting a basic challenge."""
         messages = [
             "|pm|~Challenger| BotPlayer|/challenge gen9ou",
@@ -75,7 +106,7 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
@@ -83,7 +114,7 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         self.assertEqual(sent_messages[0], "|/search gen9ou")
         self.assertEqual(sent_messages[1], "|/accept challenger")
 
-    async def test_ignore_wrong_format(self) -> None:
+    def test_ignore_wrong_format(self) -> None:
         """Test that challenges with wrong format are ignored."""
         messages = [
             "|pm|~Challenger| BotPlayer|/challenge gen9vgc2024regh",
@@ -94,7 +125,7 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
@@ -102,7 +133,26 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         self.assertEqual(sent_messages[0], "|/search gen9ou")
         self.assertEqual(sent_messages[1], "|/accept correctchallenger")
 
-    async def test_ignore_non_challenge_pms(self) -> None:
+    def test_malformed_challenge_is_logged(self) -> None:
+        """Test that a challenge PM without a format is reported as malformed."""
+        messages = [
+            "|pm|~Challenger| BotPlayer|/challenge",
+            ">battle-gen9ou-12345",
+        ]
+
+        client = FakeShowdownClient(messages)
+        handler = ChallengeHandler(client, format="gen9ou")
+
+        with mock.patch.object(challenge_handler.logging, "warning") as warning:
+            battle_room = self._listen(handler)
+
+        self.assertEqual(battle_room, "battle-gen9ou-12345")
+        warning.assert_called_once_with(
+            "Ignoring malformed challenge from %s: %r", "challenger", "/challenge"
+        )
+        self.assertEqual(client.get_sent_messages(), ["|/search gen9ou"])
+
+    def test_ignore_non_challenge_pms(self) -> None:
         """Test that non-challenge PMs are ignored."""
         messages = [
             "|pm| FriendlyUser| BotPlayer|Hello!",
@@ -114,7 +164,7 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
@@ -122,26 +172,30 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         self.assertEqual(sent_messages[0], "|/search gen9ou")
         self.assertEqual(sent_messages[1], "|/accept challenger")
 
-    @parameterized.parameters(
-        ("~Username", "username"),
-        ("+VoiceUser", "voiceuser"),
-        ("@Moderator", "moderator"),
-        ("#RoomOwner", "roomowner"),
-        ("&Administrator", "administrator"),
-        (" RegularUser", "regularuser"),
-        ("NoPrefixUser", "noprefixuser"),
-    )
-    def test_normalize_username(
-        self, input_username: str, expected_normalized: str
-    ) -> None:
+    def test_normalize_username(self) -> None:
         """Test username normalization."""
         client = FakeShowdownClient([])
         handler = ChallengeHandler(client, format="gen9ou")
 
-        normalized = handler._normalize_username(input_username)
-        self.assertEqual(normalized, expected_normalized)
+        cases = (
+            ("~Username", "username"),
+            ("+VoiceUser", "voiceuser"),
+            ("@Moderator", "moderator"),
+            ("#RoomOwner", "roomowner"),
+            ("&Administrator", "administrator"),
+            (" RegularUser", "regularuser"),
+            ("NoPrefixUser", "noprefixuser"),
+            ("+Target Opponent", "target opponent"),
+            # Only one rank prefix is removed
+            ("~@User", "@user"),
+            ("\tTabbedUser\n", "tabbeduser"),
+        )
+        for input_username, expected_normalized in cases:
+            with self.subTest(username=input_username):
+                normalized = handler._normalize_username(input_username)
+                self.assertEqual(normalized, expected_normalized)
 
-    async def test_opponent_filter_accepts_matching(self) -> None:
+    def test_opponent_filter_accepts_matching(self) -> None:
         """Test that opponent filter accepts matching username."""
         messages = [
             "|pm|~TargetOpponent| BotPlayer|/challenge gen9ou",
@@ -151,14 +205,14 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou", opponent="TargetOpponent")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
         self.assertEqual(len(sent_messages), 1)
         self.assertEqual(sent_messages[0], "|/accept targetopponent")
 
-    async def test_opponent_filter_rejects_non_matching(self) -> None:
+    def test_opponent_filter_rejects_non_matching(self) -> None:
         """Test that opponent filter rejects non-matching username."""
         messages = [
             "|pm|~WrongUser| BotPlayer|/challenge gen9ou",
@@ -170,14 +224,14 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou", opponent="TargetOpponent")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
         self.assertEqual(len(sent_messages), 1)
         self.assertEqual(sent_messages[0], "|/accept targetopponent")
 
-    async def test_opponent_filter_case_insensitive(self) -> None:
+    def test_opponent_filter_case_insensitive(self) -> None:
         """Test that opponent filter is case insensitive."""
         messages = [
             "|pm|~TARGETOPPONENT| BotPlayer|/challenge gen9ou",
@@ -187,33 +241,37 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou", opponent="targetopponent")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
         self.assertEqual(len(sent_messages), 1)
         self.assertEqual(sent_messages[0], "|/accept targetopponent")
 
-    async def test_challenge_timeout_sends_proactive_challenge(self) -> None:
+    def test_challenge_timeout_sends_proactive_challenge(self) -> None:
         """Test that timeout triggers proactive challenge."""
         messages = [
             ">battle-gen9ou-12345",
         ]
 
-        # Delay message so timeout can trigger first
-        client = FakeShowdownClient(messages, message_delay=0.02)
+        # Hold messages until the proactive challenge is sent, and skip the
+        # real timeout wait
+        client = FakeShowdownClient(messages, hold_until_sent=True)
         handler = ChallengeHandler(
-            client, format="gen9ou", opponent="TargetOpponent", challenge_timeout=0.01
+            client, format="gen9ou", opponent="TargetOpponent", challenge_timeout=10
         )
 
-        battle_room = await handler.listen_for_challenges()
+        with mock.patch.object(asyncio, "sleep", new=mock.AsyncMock()) as sleep:
+            battle_room = self._listen(handler)
+
+        sleep.assert_awaited_once_with(10)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
         self.assertEqual(len(sent_messages), 1)
         self.assertEqual(sent_messages[0], "|/challenge targetopponent, gen9ou")
 
-    async def test_challenge_timeout_cancelled_if_challenge_received(self) -> None:
+    def test_challenge_timeout_cancelled_if_challenge_received(self) -> None:
         """Test that timeout is cancelled if challenge is received."""
         messages = [
             "|pm|~TargetOpponent| BotPlayer|/challenge gen9ou",
@@ -225,14 +283,14 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
             client, format="gen9ou", opponent="TargetOpponent", challenge_timeout=10
         )
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
         self.assertEqual(len(sent_messages), 1)
         self.assertEqual(sent_messages[0], "|/accept targetopponent")
 
-    async def test_no_proactive_challenge_without_opponent(self) -> None:
+    def test_no_proactive_challenge_without_opponent(self) -> None:
         """Test that ladder search is sent instead of proactive challenge without opponent."""
         messages = [
             "|pm|~SomeChallenger| BotPlayer|/challenge gen9ou",
@@ -242,7 +300,7 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou", challenge_timeout=1)
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
         sent_messages = client.get_sent_messages()
@@ -250,19 +308,24 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         self.assertEqual(sent_messages[0], "|/search gen9ou")
         self.assertEqual(sent_messages[1], "|/accept somechallenger")
 
-    @parameterized.parameters(
-        ("/challenge gen9ou", "gen9ou"),
-        ("/challenge gen9vgc2024regh", "gen9vgc2024regh"),
-        ("/challenge gen8ou", "gen8ou"),
-        ("/challenge gen1ou", "gen1ou"),
-    )
-    def test_parse_challenge_format(self, message: str, expected_format: str) -> None:
+    def test_parse_challenge_format(self) -> None:
         """Test parsing challenge format from message."""
         client = FakeShowdownClient([])
         handler = ChallengeHandler(client, format="gen9ou")
 
-        parsed_format = handler._parse_challenge_format(message)
-        self.assertEqual(parsed_format, expected_format)
+        cases = (
+            ("/challenge gen9ou", "gen9ou"),
+            ("/challenge gen9vgc2024regh", "gen9vgc2024regh"),
+            ("/challenge gen8ou", "gen8ou"),
+            ("/challenge gen1ou", "gen1ou"),
+            ("  /challenge  Gen9OU", "gen9ou"),
+            ("/challenge", ""),
+            ("Hello!", ""),
+        )
+        for message, expected_format in cases:
+            with self.subTest(message=message):
+                parsed_format = handler._parse_challenge_format(message)
+                self.assertEqual(parsed_format, expected_format)
 
     def test_get_battle_room_before_acceptance(self) -> None:
         """Test get_battle_room returns None before acceptance."""
@@ -271,7 +334,7 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
 
         self.assertIsNone(handler.get_battle_room())
 
-    async def test_multiline_messages(self) -> None:
+    def test_multiline_messages(self) -> None:
         """Test handling multiline messages."""
         messages = [
             "|pm|~Challenger| BotPlayer|/challenge gen9ou\n>battle-gen9ou-12345",
@@ -280,11 +343,25 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
+
+        self.assertEqual(battle_room, "battle-gen9ou-12345")
+
+    def test_pm_text_cannot_forge_battle_room_join(self) -> None:
+        """Test that line separators inside a PM do not start a new line."""
+        messages = [
+            "|pm| mallory| BotPlayer|hi\u2028>battle-gen9ou-999",
+            ">battle-gen9ou-12345",
+        ]
+
+        client = FakeShowdownClient(messages)
+        handler = ChallengeHandler(client, format="gen9ou")
+
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
 
-    async def test_empty_messages_skipped(self) -> None:
+    def test_empty_messages_skipped(self) -> None:
         """Test that empty messages are skipped."""
         messages = [
             "",
@@ -297,11 +374,11 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
 
         self.assertEqual(battle_room, "battle-gen9ou-12345")
 
-    async def test_duplicate_battle_room_ignored(self) -> None:
+    def test_duplicate_battle_room_ignored(self) -> None:
         """Test that duplicate battle room joins are ignored."""
         messages = [
             ">battle-gen9ou-12345",
@@ -310,7 +387,7 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client = FakeShowdownClient(messages)
         handler = ChallengeHandler(client, format="gen9ou")
 
-        battle_room = await handler.listen_for_challenges()
+        battle_room = self._listen(handler)
         self.assertEqual(battle_room, "battle-gen9ou-12345")
 
         messages2 = [
@@ -321,7 +398,7 @@ class ChallengeHandlerTest(unittest.IsolatedAsyncioTestCase, parameterized.TestC
         client2 = FakeShowdownClient(messages2)
         handler._client = client2
 
-        battle_room2 = await handler.listen_for_challenges()
+        battle_room2 = self._listen(handler)
         self.assertEqual(battle_room2, "battle-gen9ou-67890")
 
 
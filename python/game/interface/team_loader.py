@@ -1,20 +1,63 @@
+import functools
 import random
-import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+_NAME_DELETE_TABLE = str.maketrans("", "", " -'")
 
-@dataclass
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_team_name(name: str) -> str:
+    # Species, items, abilities and moves repeat across teams and packs, so
+    # cache the result of the single-pass translate.
+    return name.translate(_NAME_DELETE_TABLE).lower()
+
+
+# Stat order used by the EV/IV spreads and the packed EVs and IVs fields
+_STAT_KEYS = ("HP", "Atk", "Def", "SpA", "SpD", "Spe")
+_STAT_INDEX = {stat: index for index, stat in enumerate(_STAT_KEYS)}
+
+# Spreads are stored in _STAT_KEYS order with unlisted stats already defaulted
+StatSpread = Tuple[int, int, int, int, int, int]
+_DEFAULT_EVS: StatSpread = (0, 0, 0, 0, 0, 0)
+_DEFAULT_IVS: StatSpread = (31, 31, 31, 31, 31, 31)
+
+
+def _parse_stats(stats_str: str, defaults: StatSpread) -> StatSpread:
+    # Each part is "<value> <stat>", e.g. "252 SpA"
+    stats = list(defaults)
+    for part in stats_str.split("/"):
+        tokens = part.split()
+        if len(tokens) >= 2 and tokens[0].isdecimal():
+            index = _STAT_INDEX.get(tokens[1])
+            if index is not None:
+                stats[index] = int(tokens[0])
+    return (stats[0], stats[1], stats[2], stats[3], stats[4], stats[5])
+
+
+# "Key: value" lines in a Pokemon block, mapped to the PokemonTeamMember field
+# they set and the parser for the value after the colon.
+_FIELD_PARSERS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "Ability": ("ability", str.strip),
+    "Tera Type": ("tera_type", str.strip),
+    "EVs": ("evs", lambda value: _parse_stats(value, _DEFAULT_EVS)),
+    "IVs": ("ivs", lambda value: _parse_stats(value, _DEFAULT_IVS)),
+    "Level": ("level", int),
+    "Shiny": ("shiny", lambda value: value.strip().lower() == "yes"),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class PokemonTeamMember:
     species: str
     nickname: Optional[str]
     item: Optional[str]
     ability: str
-    moves: List[str]
+    moves: Tuple[str, ...]
     nature: str
-    evs: Dict[str, int]
-    ivs: Dict[str, int]
+    evs: StatSpread
+    ivs: StatSpread
     gender: Optional[str]
     shiny: bool
     level: int
@@ -25,64 +68,82 @@ class TeamLoader:
     def __init__(self, format_name: str = "gen9ou", teams_dir: str = "data/teams"):
         self.format_name = format_name
         self.teams_dir = Path(teams_dir)
+        # Team files are static, so each one is parsed and packed at most once
+        self._packed_teams: Dict[Path, str] = {}
+        self._team_files_cache: Dict[str, Tuple[float, List[Path]]] = {}
 
     def load_team(self, team_index: Optional[int] = None) -> str:
         if team_index is None:
             return self.get_random_team()
 
         team_file = self.teams_dir / self.format_name / f"{team_index}.team"
-        if not team_file.exists():
+        if team_file not in self._packed_teams and not team_file.exists():
             raise FileNotFoundError(f"Team file not found: {team_file}")
 
-        team = self.parse_team_file(str(team_file))
-        return self.to_packed_format(team)
+        return self._load_packed_team(team_file)
 
     def get_random_team(self) -> str:
         format_dir = self.teams_dir / self.format_name
-        if not format_dir.exists():
-            raise FileNotFoundError(f"Format directory not found: {format_dir}")
-
-        team_files = list(format_dir.glob("*.team"))
+        try:
+            mtime = format_dir.stat().st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Format directory not found: {format_dir}"
+            ) from None
+
+        # Adding or removing a team file bumps the directory mtime, which
+        # invalidates the cached listing
+        cached = self._team_files_cache.get(self.format_name)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, list(format_dir.glob("*.team")))
+            self._team_files_cache[self.format_name] = cached
+
+        team_files = cached[1]
         if not team_files:
             raise FileNotFoundError(f"No team files found in {format_dir}")
 
         team_file = random.choice(team_files)
-        team = self.parse_team_file(str(team_file))
-        return self.to_packed_format(team)
+        return self._load_packed_team(team_file)
 
-    def parse_team_file(self, file_path: str) -> List[PokemonTeamMember]:
-        content = Path(file_path).read_text()
-        pokemon_blocks = content.strip().split("\n\n")
+    def _load_packed_team(self, team_file: Path) -> str:
+        packed = self._packed_teams.get(team_file)
+        if packed is None:
+            team = self.parse_team_file(str(team_file))
+            packed = self.to_packed_format(team)
+            self._packed_teams[team_file] = packed
+        return packed
 
-        team = []
-        for block in pokemon_blocks:
-            if not block.strip():
-                continue
-            team.append(self._parse_pokemon_block(block))
-
-        return team
-
-    def _parse_pokemon_block(self, block: str) -> PokemonTeamMember:
-        lines = [line.strip() for line in block.strip().split("\n") if line.strip()]
-
-        first_line = lines[0]
+    def parse_team_file(self, file_path: str) -> List[PokemonTeamMember]:
+        # Binary read skips the text layer; splitlines() handles any line endings
+        with open(file_path, "rb") as f:
+            content = f.read().decode("utf-8")
+        return list(self._iter_team_members(content))
+
+    def _iter_team_members(self, content: str) -> Iterator[PokemonTeamMember]:
+        # Single pass over the lines: each blank line closes the current block
+        lines: List[str] = []
+        for line in map(str.strip, content.splitlines()):
+            if line:
+                lines.append(line)
+            elif lines:
+                yield self._parse_pokemon_lines(lines)
+                lines = []
+        if lines:
+            yield self._parse_pokemon_lines(lines)
+
+    def _parse_pokemon_lines(self, lines: List[str]) -> PokemonTeamMember:
         nickname = None
-        species = first_line
-        item = None
         gender = None
 
         # Extract item if present
-        if " @ " in first_line:
-            species_part, item = first_line.split(" @ ", 1)
-            species = species_part
-        else:
-            species = first_line
+        species, has_item, item_part = lines[0].partition(" @ ")
+        item = item_part if has_item else None
 
         # Check for nickname pattern: "Nickname (Species)" or species with gender "(M/F)"
         # We need to distinguish between nickname and gender markers
-        if " (" in species and ")" in species:
-            before_paren, paren_content = species.rsplit(" (", 1)
-            paren_content = paren_content.rstrip(")")
+        before_paren, has_paren, paren_content = species.rpartition(" (")
+        if has_paren and paren_content.endswith(")"):
+            paren_content = paren_content[:-1]
 
             # Check if it's a gender marker (M, F, or N)
             if paren_content in ("M", "F", "N"):
@@ -93,66 +154,40 @@ class TeamLoader:
                 nickname = before_paren
                 species = paren_content
 
-        ability = "No Ability"
-        nature = "Serious"
-        evs = {}
-        ivs = {}
+        fields: Dict[str, Any] = {}
         moves = []
-        level = 100
-        shiny = False
-        tera_type = None
 
         for line in lines[1:]:
-            if line.startswith("Ability:"):
-                ability = line.split(":", 1)[1].strip()
-            elif line.startswith("Tera Type:"):
-                tera_type = line.split(":", 1)[1].strip()
-            elif line.startswith("EVs:"):
-                evs = self._parse_stats(line.split(":", 1)[1])
-            elif line.startswith("IVs:"):
-                ivs = self._parse_stats(line.split(":", 1)[1])
-            elif " Nature" in line:
-                nature = line.replace(" Nature", "").strip()
-            elif line.startswith("Level:"):
-                level = int(line.split(":", 1)[1].strip())
-            elif line.startswith("Shiny:"):
-                shiny = line.split(":", 1)[1].strip().lower() == "yes"
-            elif line.startswith("-"):
-                move = line[1:].strip()
-                moves.append(move)
+            if line.startswith("-"):
+                moves.append(line[1:].strip())
+                continue
+
+            key, sep, value = line.partition(":")
+            if sep:
+                field_parser = _FIELD_PARSERS.get(key)
+                if field_parser is not None:
+                    field_name, parse = field_parser
+                    fields[field_name] = parse(value)
+            elif line.endswith(" Nature"):
+                fields["nature"] = line[:-7]
 
         return PokemonTeamMember(
             species=species,
             nickname=nickname,
             item=item,
-            ability=ability,
-            moves=moves,
-            nature=nature,
-            evs=evs,
-            ivs=ivs,
+            ability=fields.get("ability", "No Ability"),
+            moves=tuple(moves),
+            nature=fields.get("nature", "Serious"),
+            evs=fields.get("evs", _DEFAULT_EVS),
+            ivs=fields.get("ivs", _DEFAULT_IVS),
             gender=gender,
-            shiny=shiny,
-            level=level,
-            tera_type=tera_type,
+            shiny=fields.get("shiny", False),
+            level=fields.get("level", 100),
+            tera_type=fields.get("tera_type"),
         )
 
-    def _parse_stats(self, stats_str: str) -> Dict[str, int]:
-        stats = {}
-        parts = stats_str.strip().split("/")
-        for part in parts:
-            part = part.strip()
-            match = re.match(r"(\d+)\s+(\w+)", part)
-            if match:
-                value, stat = match.groups()
-                stats[stat] = int(value)
-        return stats
-
     def to_packed_format(self, team: List[PokemonTeamMember]) -> str:
-        packed_pokemon: List[str] = []
-        for pokemon in team:
-            packed = self._pack_pokemon(pokemon)
-            packed_pokemon.append(packed)
-        return "]".join(packed_pokemon)
+        return "]".join(self._pack_pokemon(pokemon) for pokemon in team)
 
     def _pack_pokemon(self, pokemon: PokemonTeamMember) -> str:
         # Per Showdown spec: "SPECIES is left blank if it's identical to NICKNAME"
@@ -160,13 +195,10 @@ class TeamLoader:
         if pokemon.nickname:
             # Has explicit nickname
             nickname = self._normalize_name(pokemon.nickname)
+            species = self._normalize_name(pokemon.species)
             # Species blank if same as nickname, otherwise fill it
-            if self._normalize_name(pokemon.nickname) == self._normalize_name(
-                pokemon.species
-            ):
+            if nickname == species:
                 species = ""
-            else:
-                species = self._normalize_name(pokemon.species)
         else:
             # No nickname: put species in NICKNAME field, leave SPECIES blank
             nickname = self._normalize_name(pokemon.species)
@@ -176,27 +208,11 @@ class TeamLoader:
         moves = ",".join(self._normalize_name(m) for m in pokemon.moves)
         nature = pokemon.nature
 
-        evs_list = [
-            str(pokemon.evs.get("HP", 0)),
-            str(pokemon.evs.get("Atk", 0)),
-            str(pokemon.evs.get("Def", 0)),
-            str(pokemon.evs.get("SpA", 0)),
-            str(pokemon.evs.get("SpD", 0)),
-            str(pokemon.evs.get("Spe", 0)),
-        ]
-        evs = ",".join(evs_list)
+        evs = ",".join(map(str, pokemon.evs))
 
         gender = pokemon.gender or ""
 
-        ivs_list = [
-            str(pokemon.ivs.get("HP", 31)),
-            str(pokemon.ivs.get("Atk", 31)),
-            str(pokemon.ivs.get("Def", 31)),
-            str(pokemon.ivs.get("SpA", 31)),
-            str(pokemon.ivs.get("SpD", 31)),
-            str(pokemon.ivs.get("Spe", 31)),
-        ]
-        ivs = ",".join(ivs_list)
+        ivs = ",".join(map(str, pokemon.ivs))
 
         shiny = "S" if pokemon.shiny else ""
         level = str(pokemon.level)
@@ -223,25 +239,12 @@ class TeamLoader:
         else:
             extras_str = ""
 
-        parts = [
-            nickname,
-            species,
-            item,
-            ability,
-            moves,
-            nature,
-            evs,
-            gender,
-            ivs,
-            shiny,
-            level,
-            extras_str,
-        ]
-
-        return "|".join(parts)
+        return (
+            f"{nickname}|{species}|{item}|{ability}|{moves}|{nature}|{evs}|"
+            f"{gender}|{ivs}|{shiny}|{level}|{extras_str}"
+        )
 
     def _normalize_name(self, name: str) -> str:
         if not name:
             return ""
-        normalized = name.lower().replace(" ", "").replace("-", "").replace("'", "")
-        return normalized
+        return _normalize_team_name(name)
@@ -1,5 +1,7 @@
+import os
 import tempfile
 import unittest
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 from python.game.interface.team_loader import TeamLoader
@@ -37,10 +39,8 @@ IVs: 0 Atk
         self.assertEqual(pokemon.nature, "Timid")
         self.assertEqual(len(pokemon.moves), 4)
         self.assertIn("Thunderbolt", pokemon.moves)
-        self.assertEqual(pokemon.evs["SpA"], 252)
-        self.assertEqual(pokemon.evs["Spe"], 252)
-        self.assertEqual(pokemon.evs["SpD"], 4)
-        self.assertEqual(pokemon.ivs["Atk"], 0)
+        self.assertEqual(pokemon.evs, (0, 0, 0, 252, 4, 252))
+        self.assertEqual(pokemon.ivs, (31, 0, 31, 31, 31, 31))
 
     def test_parse_pokemon_with_gender(self) -> None:
         team_content = """Kingambit (M) @ Leftovers
@@ -63,6 +63,46 @@ Adamant Nature
         self.assertEqual(pokemon.gender, "M")
         self.assertEqual(pokemon.item, "Leftovers")
 
+    def test_parse_nature_power_move(self) -> None:
+        team_content = """Shiinotic @ Leftovers
+Ability: Effect Spore
+Level: 50
+Shiny: Yes
+Calm Nature
+- Nature Power
+- Spore
+"""
+        team_file = self.teams_dir / "gen9ou"
+        team_file.mkdir()
+        (team_file / "0.team").write_text(team_content)
+
+        loader = TeamLoader(format_name="gen9ou", teams_dir=str(self.teams_dir))
+        team = loader.parse_team_file(str(team_file / "0.team"))
+
+        pokemon = team[0]
+        self.assertEqual(pokemon.nature, "Calm")
+        self.assertEqual(pokemon.moves, ("Nature Power", "Spore"))
+        self.assertEqual(pokemon.level, 50)
+        self.assertTrue(pokemon.shiny)
+
+    def test_parsed_team_is_hashable(self) -> None:
+        team_content = """Pikachu @ Light Ball
+Ability: Static
+- Thunderbolt
+"""
+        team_file = self.teams_dir / "gen9ou"
+        team_file.mkdir()
+        (team_file / "0.team").write_text(team_content)
+
+        loader = TeamLoader(format_name="gen9ou", teams_dir=str(self.teams_dir))
+        team = loader.parse_team_file(str(team_file / "0.team"))
+
+        reparsed = loader.parse_team_file(str(team_file / "0.team"))
+
+        self.assertEqual(hash(team[0]), hash(reparsed[0]))
+        with self.assertRaises(FrozenInstanceError):
+            team[0].level = 50  # type: ignore[misc]
+
     def test_parse_pokemon_with_tera_type(self) -> None:
         team_content = """Kyurem @ Loaded Dice
 Ability: Pressure
@@ -123,6 +163,60 @@ Timid Nature
 
         self.assertIn("pikachu", packed)
 
+    def test_load_team_caches_packed_team(self) -> None:
+        team_content = """Pikachu @ Light Ball
+Ability: Static
+- Thunderbolt
+"""
+        team_file = self.teams_dir / "gen9ou"
+        team_file.mkdir()
+        (team_file / "0.team").write_text(team_content)
+
+        loader = TeamLoader(format_name="gen9ou", teams_dir=str(self.teams_dir))
+        packed = loader.load_team(team_index=0)
+        (team_file / "0.team").unlink()
+
+        self.assertEqual(loader.load_team(team_index=0), packed)
+        with self.assertRaises(FileNotFoundError):
+            loader.load_team(team_index=1)
+
+    def test_get_random_team_refreshes_listing_on_change(self) -> None:
+        team_file = self.teams_dir / "gen9ou"
+        team_file.mkdir()
+        (team_file / "0.team").write_text("Pikachu @ Light Ball\n- Thunderbolt\n")
+
+        loader = TeamLoader(format_name="gen9ou", teams_dir=str(self.teams_dir))
+        self.assertIn("pikachu", loader.get_random_team())
+
+        (team_file / "0.team").unlink()
+        (team_file / "1.team").write_text("Kyurem @ Loaded Dice\n- Icicle Spear\n")
+        mtime = team_file.stat().st_mtime
+        os.utime(team_file, (mtime + 1, mtime + 1))
+
+        self.assertIn("kyurem", loader.get_random_team())
+
+    def test_parse_team_file_with_crlf_line_endings(self) -> None:
+        team_content = (
+            "Kyurem @ Loaded Dice\r\n"
+            "Ability: Pressure\r\n"
+            "- Icicle Spear\r\n"
+            "\r\n"
+            "Iron Moth @ Booster Energy\r\n"
+            "Timid Nature\r\n"
+            "- Fiery Dance\r\n"
+        )
+        team_file = self.teams_dir / "gen9ou"
+        team_file.mkdir()
+        (team_file / "0.team").write_bytes(team_content.encode("utf-8"))
+
+        loader = TeamLoader(format_name="gen9ou", teams_dir=str(self.teams_dir))
+        team = loader.parse_team_file(str(team_file / "0.team"))
+
+        self.assertEqual(len(team), 2)
+        self.assertEqual(team[0].ability, "Pressure")
+        self.assertEqual(team[1].nature, "Timid")
+        self.assertEqual(team[1].moves, ("Fiery Dance",))
+
     def test_parse_full_team(self) -> None:
         team_content = """Kyurem @ Loaded Dice
 Ability: Pressure
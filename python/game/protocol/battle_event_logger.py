@@ -1,15 +1,43 @@
 """Logs battle events to file for debugging and analysis."""
 
-import json
 import os
-from typing import Any, Dict, Optional, TextIO
+import queue
+import threading
+from typing import Any, List, Optional, Set, Tuple
 
-from python.game.events.battle_event import BattleEvent
+import msgspec
+from absl import logging
+
+from python.game.events.battle_event import BattleEvent, EventKind
+
+# Events written between explicit flushes. Bounds what a crash can lose
+# without paying a flush syscall per event.
+_FLUSH_EVERY_EVENTS = 64
+
+# Events that flush immediately: errors and the battle end are what a crash
+# investigation needs, and turns/requests mark decision points, so the log is
+# complete up to the last point the agent acted on
+_FLUSH_KINDS = frozenset(
+    {EventKind.TURN, EventKind.ERROR, EventKind.REQUEST, EventKind.BATTLE_END}
+)
+
+# Pending bytes that force a write even before the event count is reached
+_WRITE_BUFFER_BYTES = 256 * 1024
+
+# Encodes straight to bytes, which are written to the raw file descriptor
+_encode_json = msgspec.json.Encoder().encode
+
+# Every entry has the same two keys, so only the event string needs the JSON
+# encoder (for escaping); the rest of the line is a fixed template.
+_ENTRY_TEMPLATE = b'{"turn_number":%d,"event":%b}\n'
 
 
 class BattleEventLogger:
     """Logs battle stream events to a file."""
 
+    # Log directories already created by some logger in this process
+    _ensured_dirs: Set[str] = set()
+
     def __init__(
         self,
         player_name: str,
@@ -30,14 +58,23 @@ class BattleEventLogger:
         self._player_name = player_name
         self._epoch_secs = epoch_secs
         self._opponent_name = opponent_name
-        self._file: Optional[TextIO] = None
+        self._fd: Optional[int] = None
+        self._closed = False
+        self._pending = bytearray()
         self._log_dir = log_dir
         self._battle_room = battle_room
+        self._events_since_flush = 0
+        # The file is only created once there is something to write, so
+        # battles that end before any event leave nothing behind
+        self._filepath = (
+            f"{self._log_dir}{os.sep}{self._player_name}_{self._opponent_name}"
+            f"_{self._battle_room}_{self._epoch_secs}.txt"
+        )
 
-        os.makedirs(self._log_dir, exist_ok=True)
-        filename = f"{self._player_name}_{self._opponent_name}_{self._battle_room}_{self._epoch_secs}.txt"
-        filepath = os.path.join(self._log_dir, filename)
-        self._file = open(filepath, "w")
+        # Disk writes happen on a writer thread so logging never blocks the
+        # event loop driving BattleStream. None tells the writer to stop.
+        self._writes: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
 
     def log_event(self, turn_number: int, event: BattleEvent) -> None:
         """Log a battle event.
@@ -46,19 +83,112 @@ class BattleEventLogger:
             turn_number: Current turn number in the battle
             event: BattleEvent to log
         """
-        if self._file is None:
+        if self._closed:
             return
 
-        raw_message = getattr(event, "raw_message", str(event))
-        log_entry: Dict[str, Any] = {"turn_number": turn_number, "event": raw_message}
-        self._file.write(f"{json.dumps(log_entry)}\n")
-        self._file.flush()
+        self._pending += _ENTRY_TEMPLATE % (
+            turn_number,
+            _encode_json(event.raw_message),
+        )
+        self._events_since_flush += 1
+        if event.kind in _FLUSH_KINDS:
+            self._flush()
+        else:
+            self._maybe_flush()
+
+    def log_events(self, entries: List[Tuple[int, BattleEvent]]) -> None:
+        """Log a batch of battle events with a single write.
+
+        Args:
+            entries: (turn_number, event) pairs in the order they occurred
+        """
+        if self._closed or not entries:
+            return
+
+        flush = False
+        for turn_number, event in entries:
+            self._pending += _ENTRY_TEMPLATE % (
+                turn_number,
+                _encode_json(event.raw_message),
+            )
+            flush = flush or event.kind in _FLUSH_KINDS
+        self._events_since_flush += len(entries)
+        if flush:
+            self._flush()
+        else:
+            self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if (
+            self._events_since_flush >= _FLUSH_EVERY_EVENTS
+            or len(self._pending) >= _WRITE_BUFFER_BYTES
+        ):
+            self._flush()
+
+    def _flush(self) -> None:
+        """Hand all pending bytes to the writer thread."""
+        if not self._pending:
+            return
+        if self._fd is None:
+            try:
+                self._open()
+            except OSError as e:
+                # Logging runs inside BattleStream, so a bad log path must not
+                # abort the battle; stop logging for this battle instead
+                logging.error(
+                    "Failed to open battle event log %s: %s", self._filepath, e
+                )
+                self._closed = True
+                self._pending.clear()
+                return
+
+        self._writes.put(bytes(self._pending))
+        self._pending.clear()
+        self._events_since_flush = 0
+
+    def _open(self) -> None:
+        """Create the log file and start the writer thread."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        if self._log_dir not in BattleEventLogger._ensured_dirs:
+            os.makedirs(self._log_dir, exist_ok=True)
+            BattleEventLogger._ensured_dirs.add(self._log_dir)
+        try:
+            self._fd = os.open(self._filepath, flags, 0o644)
+        except FileNotFoundError:
+            # The directory was removed since another logger created it
+            os.makedirs(self._log_dir, exist_ok=True)
+            self._fd = os.open(self._filepath, flags, 0o644)
+        self._writer = threading.Thread(
+            target=self._drain_writes, args=(self._fd,), daemon=True
+        )
+        self._writer.start()
+
+    def _drain_writes(self, fd: int) -> None:
+        while True:
+            data = self._writes.get()
+            try:
+                if data is None:
+                    return
+                while data:
+                    written = os.write(fd, data)
+                    data = data[written:]
+            except OSError as e:
+                logging.error("Failed to write battle event log: %s", e)
+            finally:
+                self._writes.task_done()
 
     def close(self) -> None:
-        """Close the log file."""
-        if self._file is not None:
-            self._file.close()
-            self._file = None
+        """Close the log file once all pending events are written."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._flush()
+        if self._fd is not None and self._writer is not None:
+            self._writes.put(None)
+            self._writer.join()
+            os.close(self._fd)
+            self._fd = None
 
     def __enter__(self) -> "BattleEventLogger":
         return self
@@ -5,8 +5,17 @@ import os
 import tempfile
 import unittest
 
-from python.game.events.battle_event import BattleEvent
-from python.game.protocol.battle_event_logger import BattleEventLogger
+from python.game.events.battle_event import (
+    BattleEndEvent,
+    BattleEvent,
+    ErrorEvent,
+    RequestEvent,
+    TurnEvent,
+)
+from python.game.protocol.battle_event_logger import (
+    _FLUSH_EVERY_EVENTS,
+    BattleEventLogger,
+)
 
 
 class MockBattleEvent(BattleEvent):
@@ -36,19 +45,58 @@ class BattleEventLoggerTest(unittest.TestCase):
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
 
-    def test_init_creates_directory(self) -> None:
-        """Test that __init__ creates the log directory."""
+    def test_log_dir_created_on_first_event(self) -> None:
+        """Test that the log directory and file are created lazily."""
+        log_dir = os.path.join(self.test_dir, "nested", "logs")
         logger = BattleEventLogger(
             player_name="test_player",
             epoch_secs=1234567890,
             battle_room="battle-test-123",
             opponent_name="opponent1",
-            log_dir=self.test_dir,
+            log_dir=log_dir,
+        )
+        self.assertFalse(os.path.exists(log_dir))
+
+        logger.log_event(turn_number=1, event=MockBattleEvent(raw_message="|start"))
+        logger.close()
+
+        self.assertEqual(
+            os.listdir(log_dir),
+            ["test_player_opponent1_battle-test-123_1234567890.txt"],
+        )
+
+    def test_unwritable_log_dir_does_not_raise(self) -> None:
+        """Test that a log file that cannot be created disables logging."""
+        blocking_file = os.path.join(self.test_dir, "not_a_dir")
+        with open(blocking_file, "w"):
+            pass
+        logger = BattleEventLogger(
+            player_name="test_player",
+            epoch_secs=1234567890,
+            battle_room="battle-test-bad-dir",
+            opponent_name="opponent1",
+            log_dir=os.path.join(blocking_file, "logs"),
         )
 
-        self.assertTrue(os.path.exists(self.test_dir))
+        logger.log_event(turn_number=1, event=TurnEvent.parse_raw_message("|turn|1"))
+        logger.log_event(turn_number=2, event=TurnEvent.parse_raw_message("|turn|2"))
         logger.close()
 
+        self.assertEqual(os.listdir(self.test_dir), ["not_a_dir"])
+
+    def test_no_file_without_events(self) -> None:
+        """Test that closing a logger with no events leaves no file behind."""
+        logger = BattleEventLogger(
+            player_name="test_player",
+            epoch_secs=1234567890,
+            battle_room="battle-test-empty",
+            opponent_name="opponent1",
+            log_dir=self.test_dir,
+        )
+        logger.close()
+
+        self.assertEqual(os.listdir(self.test_dir), [])
+
     def test_log_event_writes_to_file(self) -> None:
         """Test that log_event writes events to the correct file."""
         epoch_secs = 1234567890
@@ -114,6 +162,98 @@ class BattleEventLoggerTest(unittest.TestCase):
                 self.assertEqual(log_entry["turn_number"], i + 1)
                 self.assertIn("event", log_entry)
 
+    def test_log_events_writes_batch(self) -> None:
+        """Test that log_events writes one line per entry in order."""
+        epoch_secs = 6666666666
+        logger = BattleEventLogger(
+            player_name="test_player",
+            epoch_secs=epoch_secs,
+            battle_room="battle-test-batch",
+            opponent_name="opponent9",
+            log_dir=self.test_dir,
+        )
+
+        logger.log_events(
+            [
+                (1, MockBattleEvent(raw_message="|turn|1")),
+                (1, MockBattleEvent(raw_message="|move|p1a: Pikachu|Thunderbolt")),
+                (2, MockBattleEvent(raw_message="|turn|2")),
+            ]
+        )
+        logger.log_events([])
+        logger.close()
+
+        expected_path = os.path.join(
+            self.test_dir, f"test_player_opponent9_battle-test-batch_{epoch_secs}.txt"
+        )
+        with open(expected_path, "r") as f:
+            log_entries = [json.loads(line) for line in f.readlines()]
+
+        self.assertEqual([entry["turn_number"] for entry in log_entries], [1, 1, 2])
+        self.assertEqual(log_entries[2]["event"], "|turn|2")
+
+    def test_events_flushed_in_batches(self) -> None:
+        """Test that events reach the file every _FLUSH_EVERY_EVENTS events."""
+        epoch_secs = 5555555555
+        logger = BattleEventLogger(
+            player_name="test_player",
+            epoch_secs=epoch_secs,
+            battle_room="battle-test-flush",
+            opponent_name="opponent8",
+            log_dir=self.test_dir,
+        )
+
+        for _ in range(_FLUSH_EVERY_EVENTS):
+            logger.log_event(turn_number=1, event=MockBattleEvent(raw_message="|"))
+
+        # Wait for the writer thread to finish the flushed batch
+        logger._writes.join()
+
+        expected_path = os.path.join(
+            self.test_dir, f"test_player_opponent8_battle-test-flush_{epoch_secs}.txt"
+        )
+        with open(expected_path, "r") as f:
+            self.assertEqual(len(f.readlines()), _FLUSH_EVERY_EVENTS)
+
+        logger.close()
+
+    def test_decision_and_error_events_flush_immediately(self) -> None:
+        """Test that turns, requests, errors and the battle end are not held
+        back waiting for a full batch."""
+        epoch_secs = 6666666666
+        logger = BattleEventLogger(
+            player_name="test_player",
+            epoch_secs=epoch_secs,
+            battle_room="battle-test-kinds",
+            opponent_name="opponent9",
+            log_dir=self.test_dir,
+        )
+        expected_path = os.path.join(
+            self.test_dir, f"test_player_opponent9_battle-test-kinds_{epoch_secs}.txt"
+        )
+
+        flushing_events = [
+            TurnEvent.parse_raw_message("|turn|2"),
+            ErrorEvent.parse_raw_message("|error|[Invalid choice] Can't move"),
+            RequestEvent.parse_raw_message('|request|{"wait": true}'),
+            BattleEndEvent.parse_raw_message("|win|Player1"),
+        ]
+        for index, event in enumerate(flushing_events):
+            with self.subTest(event=type(event).__name__):
+                logger.log_events(
+                    [(1, MockBattleEvent(raw_message="|upkeep")), (1, event)]
+                )
+                logger._writes.join()
+                with open(expected_path, "r") as f:
+                    self.assertEqual(len(f.readlines()), 2 * (index + 1))
+
+        logger.log_event(turn_number=2, event=flushing_events[0])
+        logger._writes.join()
+        with open(expected_path, "r") as f:
+            self.assertEqual(len(f.readlines()), 2 * len(flushing_events) + 1)
+
+        logger.close()
+
     def test_context_manager(self) -> None:
         """Test that BattleEventLogger works as a context manager."""
         epoch_secs = 1111111111
@@ -165,44 +305,6 @@ class BattleEventLoggerTest(unittest.TestCase):
         event = MockBattleEvent(raw_message="|end")
         logger.log_event(turn_number=1, event=event)
 
-    def test_event_without_raw_message(self) -> None:
-        """Test handling events without raw_message attribute."""
-
-        class EventWithoutRawMessage(BattleEvent):
-            """Event without raw_message attribute."""
-
-            @classmethod
-            def parse_raw_message(cls, raw_message: str) -> "EventWithoutRawMessage":
-                """Parse raw message."""
-                return cls()
-
-        epoch_secs = 4444444444
-        logger = BattleEventLogger(
-            player_name="test_player",
-            epoch_secs=epoch_secs,
-            battle_room="battle-test-no-raw",
-            opponent_name="opponent7",
-            log_dir=self.test_dir,
-        )
-
-        event = EventWithoutRawMessage()
-        logger.log_event(turn_number=1, event=event)
-        logger.close()
-
-        expected_path = os.path.join(
-            self.test_dir, f"test_player_opponent7_battle-test-no-raw_{epoch_secs}.txt"
-        )
-        self.assertTrue(os.path.exists(expected_path))
-
-        with open(expected_path, "r") as f:
-            content = f.read()
-            lines = content.strip().split("\n")
-            self.assertEqual(len(lines), 1)
-
-            log_entry = json.loads(lines[0])
-            self.assertEqual(log_entry["turn_number"], 1)
-            self.assertIn("event", log_entry)
-
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,19 +1,34 @@
 """Async event stream for batching battle events between decision points."""
 
-from typing import Any, AsyncIterator, List, Literal, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    cast,
+)
 
 from absl import logging
 
 from python.game.events.battle_event import (
-    BattleEndEvent,
     BattleEvent,
     ErrorEvent,
-    RequestEvent,
+    EventKind,
     TurnEvent,
 )
 from python.game.protocol.battle_event_logger import BattleEventLogger
 from python.game.protocol.message_parser import MessageParser
 
+# Event kinds that end a batch in each mode
+_DECISION_KINDS: Dict[str, FrozenSet[EventKind]] = {
+    "live": frozenset({EventKind.REQUEST, EventKind.BATTLE_END}),
+    "replay": frozenset({EventKind.TURN}),
+}
+
 
 class BattleStream:
     """Async iterator that batches battle events between decision points.
@@ -43,6 +58,8 @@ class BattleStream:
         self._client = client
         self._parser = parser or MessageParser()
         self._mode = mode
+        # Live mode stops at |request| or the battle end, replay mode at |turn|
+        self._decision_kinds = _DECISION_KINDS[mode]
         self._battle_id = battle_id
         self._logger = logger
         self._buffer: List[BattleEvent] = []
@@ -68,18 +85,49 @@ class BattleStream:
         if self._done:
             raise StopAsyncIteration
 
+        # Events are logged in one write per batch rather than one per event
+        log_entries: List[Tuple[int, BattleEvent]] = []
+        try:
+            return await self._read_batch(log_entries)
+        finally:
+            if self._logger and log_entries:
+                self._logger.log_events(log_entries)
+
+    async def _read_batch(
+        self, log_entries: List[Tuple[int, BattleEvent]]
+    ) -> List[BattleEvent]:
+        """Read events up to the next decision point.
+
+        Args:
+            log_entries: Collects (turn_number, event) pairs to log when a
+                logger is set
+
+        Returns:
+            List of BattleEvent objects
+
+        Raises:
+            StopAsyncIteration: When stream is complete
+        """
         batch: List[BattleEvent] = []
-        decision_event_found = False
 
-        while not decision_event_found:
-            if not self._client.is_connected:
+        # Bound once per batch rather than looked up for every message/event
+        client = self._client
+        receive = client.receive_message
+        parse_block = self._parser.parse_block
+        battle_id = self._battle_id
+        decision_kinds = self._decision_kinds
+        log_entry = log_entries.append if self._logger else None
+        turn_number = self._current_turn_number
+
+        while True:
+            if not client.is_connected:
                 self._done = True
                 if batch:
                     return batch
                 raise StopAsyncIteration
 
             try:
-                raw_message = await self._client.receive_message()
+                raw_message = await receive()
             except Exception as e:
                 logging.error("Error receiving message: %s", e)
                 self._done = True
@@ -87,76 +135,39 @@ class BattleStream:
                     return batch
                 raise StopAsyncIteration
 
-            if not raw_message.strip():
+            if not raw_message or raw_message.isspace():
                 continue
 
-            # Check if entire message belongs to our battle (first line has >ROOMID)
-            if self._battle_id and not self._matches_battle_id(raw_message):
+            # Check if entire message belongs to our battle (first line has
+            # >ROOMID). For simplicity, check if battle ID appears in message.
+            if battle_id and battle_id not in raw_message:
                 continue
 
-            for line in raw_message.split("\n"):
-                if not line.strip():
-                    continue
-
-                if line.startswith(">"):
-                    continue
-
-                event = self._parser.parse(line)
-                batch.append(event)
-
-                if isinstance(event, TurnEvent):
-                    self._current_turn_number = event.turn_number
-
-                if isinstance(event, ErrorEvent):
+            # Split on "\n" only, so separators inside chat text (\r, U+2028)
+            # cannot start a forged protocol line
+            events = parse_block(raw_message)
+            for index, event in enumerate(events):
+                kind = event.kind
+                if kind == EventKind.TURN:
+                    turn_number = cast(TurnEvent, event).turn_number
+                    self._current_turn_number = turn_number
+                elif kind == EventKind.ERROR:
                     logging.error(
-                        "[%s] Server error: %s", self._battle_id, event.error_text
+                        "[%s] Server error: %s",
+                        battle_id,
+                        cast(ErrorEvent, event).error_text,
                     )
 
-                if self._logger:
-                    self._logger.log_event(self._current_turn_number, event)
-
-                if self._is_decision_point(event):
-                    decision_event_found = True
-                    break
+                if log_entry is not None:
+                    log_entry((turn_number, event))
 
-            if decision_event_found:
-                return batch
-
-        return batch
-
-    def _matches_battle_id(self, raw_message: str) -> bool:
-        """Check if message belongs to the specified battle.
-
-        Args:
-            raw_message: Raw protocol message
-
-        Returns:
-            True if message matches battle ID or battle ID not set
-        """
-        if not self._battle_id:
-            return True
-
-        # Battle-specific messages start with ">battle-BATTLEID"
-        # For simplicity, check if battle ID appears in message
-        return self._battle_id in raw_message
-
-    def _is_decision_point(self, event: BattleEvent) -> bool:
-        """Check if event is a decision point.
-
-        In live mode: RequestEvent or BattleEndEvent signals decision point
-        In replay mode: TurnEvent signals decision point
-
-        Args:
-            event: BattleEvent to check
-
-        Returns:
-            True if this event signals a decision point
-        """
+                if kind in decision_kinds:
+                    # Events after the decision point in this frame are dropped
+                    batch.extend(events[: index + 1])
+                    return batch
 
-        if self._mode == "live":
-            return isinstance(event, (RequestEvent, BattleEndEvent))
-        else:  # replay mode
-            return isinstance(event, TurnEvent)
+            # Add the frame's events in one go rather than appending each
+            batch.extend(events)
 
     async def close(self) -> None:
         """Mark stream as done."""
@@ -1,16 +1,22 @@
 """Tests for BattleStream event batching."""
 
+import json
+import os
+import tempfile
 import unittest
 from typing import List
+from unittest import mock
 
 from python.game.events.battle_event import (
     BattleEvent,
     DamageEvent,
+    IgnoredEvent,
     MoveEvent,
     RequestEvent,
     SwitchEvent,
     TurnEvent,
 )
+from python.game.protocol.battle_event_logger import BattleEventLogger
 from python.game.protocol.battle_stream import BattleStream
 
 
@@ -74,6 +80,24 @@ class BattleStreamTest(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(batch[3], DamageEvent)
         self.assertIsInstance(batch[4], RequestEvent)
 
+    async def test_chat_text_cannot_forge_protocol_lines(self) -> None:
+        """Test that only newlines split a frame, not separators in chat."""
+        client = FakeShowdownClient(
+            [
+                ">battle-gen9ou-1\n"
+                "|c|mallory|gg\u2028|win|mallory\n"
+                "|move|p1a: Pikachu|Thunderbolt|p2a: Charizard\n"
+                '|request|{"active":[{"moves":[]}]}'
+            ]
+        )
+        stream = BattleStream(client, mode="live")
+
+        batch = await stream.__anext__()
+
+        self.assertEqual(
+            [type(event) for event in batch], [IgnoredEvent, MoveEvent, RequestEvent]
+        )
+
     async def test_replay_mode_batches_until_turn(self) -> None:
         """Test that replay mode batches events until next TurnEvent."""
         messages = [
@@ -158,6 +182,44 @@ class BattleStreamTest(unittest.IsolatedAsyncioTestCase):
         # Should get exactly one batch
         self.assertEqual(len(batches), 1)
 
+    async def test_logger_receives_one_batch_per_decision_point(self) -> None:
+        """Test that events are logged once per batch with their turn number."""
+        messages = [
+            "|turn|1",
+            "|move|p1a: Pikachu|Thunderbolt|p2a: Charizard\n|turn|2",
+        ]
+
+        client = FakeShowdownClient(messages)
+        with tempfile.TemporaryDirectory() as log_dir:
+            logger = BattleEventLogger(
+                player_name="test_player",
+                epoch_secs=1234567890,
+                battle_room="battle-test-stream",
+                opponent_name="opponent1",
+                log_dir=log_dir,
+            )
+            stream = BattleStream(client, mode="replay", logger=logger)
+
+            with mock.patch.object(
+                logger, "log_events", wraps=logger.log_events
+            ) as log_events:
+                async for _ in stream:
+                    pass
+            logger.close()
+
+            expected_path = os.path.join(
+                log_dir, "test_player_opponent1_battle-test-stream_1234567890.txt"
+            )
+            with open(expected_path, "r") as f:
+                entries = [json.loads(line) for line in f]
+
+        self.assertEqual(log_events.call_count, 2)
+        self.assertEqual([entry["turn_number"] for entry in entries], [1, 1, 2])
+        self.assertEqual(
+            [entry["event"] for entry in entries],
+            ["|turn|1", "|move|p1a: Pikachu|Thunderbolt|p2a: Charizard", "|turn|2"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
-from typing import Dict, Type
+import functools
+from typing import Callable, Dict, FrozenSet, List, Set, Type
 
 from absl import logging
 
@@ -69,72 +70,72 @@ from python.game.events.battle_event import (
 )
 
 
-class MessageParser:
-    MESSAGE_TYPE_MAP: Dict[str, Type[BattleEvent]] = {
-        "turn": TurnEvent,
-        "start": BattleStartEvent,
-        "win": BattleEndEvent,
-        "player": PlayerEvent,
-        "teamsize": TeamSizeEvent,
-        "gen": GenEvent,
-        "tier": TierEvent,
-        "gametype": GameTypeEvent,
-        "pm": PrivateMessageEvent,
-        "popup": PopupEvent,
-        "error": ErrorEvent,
-        "updatesearch": UpdateSearchEvent,
-        "switch": SwitchEvent,
-        "drag": DragEvent,
-        "-damage": DamageEvent,
-        "-heal": HealEvent,
-        "faint": FaintEvent,
-        "-status": StatusEvent,
-        "-curestatus": CureStatusEvent,
-        "move": MoveEvent,
-        "-boost": BoostEvent,
-        "-unboost": UnboostEvent,
-        "-setboost": SetBoostEvent,
-        "-clearboost": ClearBoostEvent,
-        "-clearallboost": ClearAllBoostEvent,
-        "-clearnegativeboost": ClearNegativeBoostEvent,
-        "-ability": AbilityEvent,
-        "-endability": EndAbilityEvent,
-        "-item": ItemEvent,
-        "-enditem": EndItemEvent,
-        "-start": StartVolatileEvent,
-        "-end": EndVolatileEvent,
-        "-singleturn": SingleTurnEvent,
-        "-singlemove": SingleMoveEvent,
-        "-weather": WeatherEvent,
-        "-fieldstart": FieldStartEvent,
-        "-fieldend": FieldEndEvent,
-        "-sidestart": SideStartEvent,
-        "-sideend": SideEndEvent,
-        "-terastallize": TerastallizeEvent,
-        "-formechange": FormeChangeEvent,
-        "-transform": TransformEvent,
-        "-activate": ActivateEvent,
-        "-prepare": PrepareEvent,
-        "cant": CantEvent,
-        "-supereffective": SuperEffectiveEvent,
-        "-resisted": ResistedEvent,
-        "-immune": ImmuneEvent,
-        "-crit": CritEvent,
-        "-miss": MissEvent,
-        "-fail": FailEvent,
-        "-hitcount": HitCountEvent,
-        "-sethp": SetHpEvent,
-        "replace": ReplaceEvent,
-        "detailschange": DetailsChangeEvent,
-        "poke": PokeEvent,
-        "clearpoke": ClearPokeEvent,
-        "teampreview": TeamPreviewEvent,
-        "upkeep": UpkeepEvent,
-        "request": RequestEvent,
-    }
+_MESSAGE_TYPE_MAP: Dict[str, Type[BattleEvent]] = {
+    "turn": TurnEvent,
+    "start": BattleStartEvent,
+    "win": BattleEndEvent,
+    "player": PlayerEvent,
+    "teamsize": TeamSizeEvent,
+    "gen": GenEvent,
+    "tier": TierEvent,
+    "gametype": GameTypeEvent,
+    "pm": PrivateMessageEvent,
+    "popup": PopupEvent,
+    "error": ErrorEvent,
+    "updatesearch": UpdateSearchEvent,
+    "switch": SwitchEvent,
+    "drag": DragEvent,
+    "-damage": DamageEvent,
+    "-heal": HealEvent,
+    "faint": FaintEvent,
+    "-status": StatusEvent,
+    "-curestatus": CureStatusEvent,
+    "move": MoveEvent,
+    "-boost": BoostEvent,
+    "-unboost": UnboostEvent,
+    "-setboost": SetBoostEvent,
+    "-clearboost": ClearBoostEvent,
+    "-clearallboost": ClearAllBoostEvent,
+    "-clearnegativeboost": ClearNegativeBoostEvent,
+    "-ability": AbilityEvent,
+    "-endability": EndAbilityEvent,
+    "-item": ItemEvent,
+    "-enditem": EndItemEvent,
+    "-start": StartVolatileEvent,
+    "-end": EndVolatileEvent,
+    "-singleturn": SingleTurnEvent,
+    "-singlemove": SingleMoveEvent,
+    "-weather": WeatherEvent,
+    "-fieldstart": FieldStartEvent,
+    "-fieldend": FieldEndEvent,
+    "-sidestart": SideStartEvent,
+    "-sideend": SideEndEvent,
+    "-terastallize": TerastallizeEvent,
+    "-formechange": FormeChangeEvent,
+    "-transform": TransformEvent,
+    "-activate": ActivateEvent,
+    "-prepare": PrepareEvent,
+    "cant": CantEvent,
+    "-supereffective": SuperEffectiveEvent,
+    "-resisted": ResistedEvent,
+    "-immune": ImmuneEvent,
+    "-crit": CritEvent,
+    "-miss": MissEvent,
+    "-fail": FailEvent,
+    "-hitcount": HitCountEvent,
+    "-sethp": SetHpEvent,
+    "replace": ReplaceEvent,
+    "detailschange": DetailsChangeEvent,
+    "poke": PokeEvent,
+    "clearpoke": ClearPokeEvent,
+    "teampreview": TeamPreviewEvent,
+    "upkeep": UpkeepEvent,
+    "request": RequestEvent,
+}
 
-    # Known message types that are metadata/UI and can be safely ignored
-    IGNORED_MESSAGE_TYPES = {
+# Known message types that are metadata/UI and can be safely ignored
+_IGNORED_MESSAGE_TYPES: FrozenSet[str] = frozenset(
+    {
         "",  # Empty message type
         "badge",  # Badge/medal display
         "uhtml",  # HTML UI elements
@@ -155,16 +156,73 @@ class MessageParser:
         "n",  # Name change
         "chat",  # Chat message (alternate)
     }
+)
+
+
+# Bound parse_raw_message per type, so dispatch is one dict lookup and a call
+_PARSERS: Dict[str, Callable[[str], BattleEvent]] = {
+    message_type: event_class.parse_raw_message
+    for message_type, event_class in _MESSAGE_TYPE_MAP.items()
+}
 
-    def parse(self, raw_message: str) -> BattleEvent:
-        parts = raw_message.split("|")
-        message_type = parts[1] if len(parts) > 1 else ""
+# Bounded because unknown tags can come from user-controlled text
+_MAX_WARNED_MESSAGE_TYPES = 1024
+_warned_message_types: Set[str] = set()
 
-        event_class = self.MESSAGE_TYPE_MAP.get(message_type)
-        if event_class:
-            return event_class.parse_raw_message(raw_message)
-        if message_type in self.IGNORED_MESSAGE_TYPES:
-            return IgnoredEvent(raw_message=raw_message, message_type=message_type)
 
+def _parse_message(raw_message: str) -> BattleEvent:
+    # The type is the text between the first two "|"; stop splitting there
+    # rather than splitting every field, which parse_raw_message does anyway
+    parts = raw_message.split("|", 2)
+    message_type = parts[1] if len(parts) > 1 else ""
+
+    parse_raw_message = _PARSERS.get(message_type)
+    if parse_raw_message:
+        return parse_raw_message(raw_message)
+    if message_type in _IGNORED_MESSAGE_TYPES:
+        return IgnoredEvent(raw_message=raw_message, message_type=message_type)
+
+    # Unknown tags are usually newer Showdown additions that recur every
+    # turn; report each one once instead of paying for a log call per line
+    if message_type not in _warned_message_types:
+        if len(_warned_message_types) >= _MAX_WARNED_MESSAGE_TYPES:
+            _warned_message_types.clear()
+        _warned_message_types.add(message_type)
         logging.warning("Unknown message type: %s", message_type)
-        return UnknownEvent(raw_message=raw_message, message_type=message_type)
+    return UnknownEvent(raw_message=raw_message, message_type=message_type)
+
+
+# Lines longer than this (requests, long chat) are rarely repeated verbatim,
+# so they bypass the cache instead of evicting the short lines that are.
+_CACHED_MESSAGE_MAX_LEN = 256
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_message_cached(raw_message: str) -> BattleEvent:
+    return _parse_message(raw_message)
+
+
+def parse_message(raw_message: str) -> BattleEvent:
+    # Events are frozen, so identical lines (e.g. "|upkeep", "|" or repeated
+    # hazard damage) can share one parsed instance
+    if len(raw_message) > _CACHED_MESSAGE_MAX_LEN:
+        return _parse_message(raw_message)
+    return _parse_message_cached(raw_message)
+
+
+class MessageParser:
+    MESSAGE_TYPE_MAP = _MESSAGE_TYPE_MAP
+    IGNORED_MESSAGE_TYPES = _IGNORED_MESSAGE_TYPES
+
+    # The parser holds no state, so parse is the module function itself
+    parse = staticmethod(parse_message)
+
+    def parse_block(self, block: str) -> List[BattleEvent]:
+        # Skips blank lines and ">ROOMID" headers, which carry no event. The
+        # protocol is "\n"-delimited only; splitlines() would also break on
+        # characters like U+2028 that users can put in chat text.
+        return [
+            parse_message(line)
+            for line in block.split("\n")
+            if line and not line.isspace() and not line.startswith(">")
+        ]
@@ -1,12 +1,15 @@
 from typing import Optional
+from unittest import mock
 
 from absl.testing import absltest, parameterized
 
 from python.game.events.battle_event import (
+    BattleEndEvent,
     BoostEvent,
     ClearPokeEvent,
     CritEvent,
     DamageEvent,
+    EventKind,
     FaintEvent,
     GenEvent,
     HealEvent,
@@ -29,10 +32,16 @@ from python.game.events.battle_event import (
     UnboostEvent,
     UpkeepEvent,
 )
-from python.game.protocol.message_parser import MessageParser
+from python.game.protocol import message_parser
+from python.game.protocol.message_parser import MessageParser, parse_message
 
 
 class MessageParserTest(parameterized.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.parser = MessageParser()
+
     @parameterized.parameters(
         ("|turn|1", 1),
         ("|turn|2", 2),
@@ -40,8 +49,7 @@ class MessageParserTest(parameterized.TestCase):
         ("|turn|25", 25),
     )
     def test_parse_turn(self, raw_message: str, expected_turn: int) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, TurnEvent)
         self.assertEqual(event.turn_number, expected_turn)
 
@@ -51,8 +59,7 @@ class MessageParserTest(parameterized.TestCase):
         ("|gen|8", 8),
     )
     def test_parse_gen(self, raw_message: str, expected_gen: int) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, GenEvent)
         self.assertEqual(event.generation, expected_gen)
 
@@ -61,8 +68,7 @@ class MessageParserTest(parameterized.TestCase):
         ("|tier|[gen 9] ubers", "[gen 9] ubers"),
     )
     def test_parse_tier(self, raw_message: str, expected_tier: str) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, TierEvent)
         self.assertEqual(event.tier, expected_tier)
 
@@ -79,8 +85,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_avatar: str,
         expected_rating: int,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, PlayerEvent)
         self.assertEqual(event.player_id, expected_player_id)
         self.assertEqual(event.username, expected_username)
@@ -94,8 +99,7 @@ class MessageParserTest(parameterized.TestCase):
     def test_parse_teamsize(
         self, raw_message: str, expected_player: str, expected_size: int
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, TeamSizeEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.size, expected_size)
@@ -279,8 +283,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_gender: str | None,
         expected_status: str | None,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, SwitchEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -382,8 +385,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_status: str | None,
         expected_source: str | None,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, DamageEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -459,8 +461,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_hp_max: int,
         expected_source: str | None,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, HealEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -484,8 +485,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_position: str,
         expected_name: str,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, FaintEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -503,8 +503,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_name: str,
         expected_status: str,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, StatusEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -674,8 +673,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_target_position: str | None,
         expected_target_name: str | None,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, MoveEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -702,8 +700,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_stat: str,
         expected_amount: int,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, BoostEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -725,8 +722,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_stat: str,
         expected_amount: int,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, UnboostEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -746,8 +742,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_position: str,
         expected_name: str,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, SuperEffectiveEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -765,8 +760,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_position: str,
         expected_name: str,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, ResistedEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -784,8 +778,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_position: str,
         expected_name: str,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, ImmuneEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -803,8 +796,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_position: str,
         expected_name: str,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, CritEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -821,8 +813,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_position: str,
         expected_name: str,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, MissEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -841,8 +832,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_name: str,
         expected_count: int,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, HitCountEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.position, expected_position)
@@ -862,8 +852,7 @@ class MessageParserTest(parameterized.TestCase):
         expected_gender: Optional[str],
         expected_shiny: bool,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, PokeEvent)
         self.assertEqual(event.player_id, expected_player)
         self.assertEqual(event.species, expected_species)
@@ -871,24 +860,20 @@ class MessageParserTest(parameterized.TestCase):
         self.assertEqual(event.shiny, expected_shiny)
 
     def test_parse_clearpoke(self) -> None:
-        parser = MessageParser()
-        event = parser.parse("|clearpoke")
+        event = self.parser.parse("|clearpoke")
         self.assertIsInstance(event, ClearPokeEvent)
 
     def test_parse_teampreview(self) -> None:
-        parser = MessageParser()
-        event = parser.parse("|teampreview")
+        event = self.parser.parse("|teampreview")
         self.assertIsInstance(event, TeamPreviewEvent)
 
     def test_parse_upkeep(self) -> None:
-        parser = MessageParser()
-        event = parser.parse("|upkeep")
+        event = self.parser.parse("|upkeep")
         self.assertIsInstance(event, UpkeepEvent)
 
     def test_parse_request(self) -> None:
-        parser = MessageParser()
         request_json = '{"active":[{"moves":[{"move":"Thunderbolt"}]}]}'
-        event = parser.parse(f"|request|{request_json}")
+        event = self.parser.parse(f"|request|{request_json}")
         self.assertIsInstance(event, RequestEvent)
         self.assertEqual(event.request_json, request_json)
 
@@ -925,13 +910,67 @@ class MessageParserTest(parameterized.TestCase):
         expected_recipient: str,
         expected_message: str,
     ) -> None:
-        parser = MessageParser()
-        event = parser.parse(raw_message)
+        event = self.parser.parse(raw_message)
         self.assertIsInstance(event, PrivateMessageEvent)
         self.assertEqual(event.sender, expected_sender)
         self.assertEqual(event.recipient, expected_recipient)
         self.assertEqual(event.message, expected_message)
 
+    @parameterized.parameters(
+        ("|turn|1", EventKind.TURN),
+        ("|error|[Invalid choice] Can't move", EventKind.ERROR),
+        ('|request|{"wait": true}', EventKind.REQUEST),
+        ("|win|Player1", EventKind.BATTLE_END),
+        ("|upkeep", EventKind.OTHER),
+    )
+    def test_event_kind(self, raw_message: str, expected_kind: EventKind) -> None:
+        event = self.parser.parse(raw_message)
+        self.assertEqual(event.kind, expected_kind)
+
+    @parameterized.parameters(
+        "|turn|1",
+        "|switch|p1a: Pikachu|Pikachu, L50|100/100",
+        "|unknowntag|data",
+    )
+    def test_events_have_no_instance_dict(self, raw_message: str) -> None:
+        event = parse_message(raw_message)
+        self.assertFalse(hasattr(event, "__dict__"))
+
+    def test_unknown_message_type_warns_once(self) -> None:
+        with mock.patch.object(message_parser.logging, "warning") as warning:
+            parse_message("|brandnewtag|a")
+            parse_message("|brandnewtag|b")
+
+        warning.assert_called_once_with("Unknown message type: %s", "brandnewtag")
+
+    def test_parse_message_matches_parser(self) -> None:
+        raw_message = "|switch|p1a: Pikachu|Pikachu, L50|100/100"
+        self.assertEqual(parse_message(raw_message), self.parser.parse(raw_message))
+
+    def test_repeated_short_lines_share_event(self) -> None:
+        self.assertIs(parse_message("|upkeep"), parse_message("|upkeep"))
+
+        long_message = "|request|" + "x" * 300
+        self.assertIsNot(parse_message(long_message), parse_message(long_message))
+
+    def test_parse_block_splits_on_newline_only(self) -> None:
+        events = self.parser.parse_block("|c|mallory|gg\u2028|win|mallory\r\x85|turn|2")
+        self.assertEqual(len(events), 1)
+        self.assertNotIsInstance(events[0], BattleEndEvent)
+
+    def test_warned_message_types_are_bounded(self) -> None:
+        with mock.patch.object(message_parser, "_MAX_WARNED_MESSAGE_TYPES", 2):
+            with mock.patch.object(message_parser.logging, "warning"):
+                for index in range(5):
+                    parse_message(f"|boundedtag{index}|data")
+            self.assertLessEqual(len(message_parser._warned_message_types), 2)
+
+    def test_parse_block(self) -> None:
+        events = self.parser.parse_block(">battle-gen9ou-1\n|\n|turn|3\n  \n|upkeep")
+        self.assertEqual(len(events), 3)
+        self.assertIsInstance(events[1], TurnEvent)
+        self.assertIsInstance(events[2], UpkeepEvent)
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -1,9 +1,9 @@
 """WebSocket client for connecting to Pokemon Showdown servers."""
 
-import json
 from typing import Any, Optional
 
 import httpx
+import msgspec
 import websockets
 from absl import logging
 
@@ -39,7 +39,9 @@ class ShowdownClient:
         self._username = username
 
         logging.info("Connecting to %s as %s", server_url, username)
-        self._ws = await websockets.connect(server_url)
+        # Battles usually run against a local server, where per-frame deflate
+        # costs CPU on every protocol message without saving any bandwidth
+        self._ws = await websockets.connect(server_url, compression=None)
         logging.info("WebSocket connection established")
 
         await self._authenticate(username, password)
@@ -95,9 +97,9 @@ class ShowdownClient:
         """Wait for and extract the challstr from the server."""
         while True:
             message = await self.receive_message()
-            if "|challstr|" in message:
-                parts = message.split("|challstr|")
-                return parts[1].strip()
+            _, found, challstr = message.partition("|challstr|")
+            if found:
+                return challstr.strip()
         raise RuntimeError("Failed to receive challstr from server")
 
     async def _get_assertion(self, username: str, password: str, challstr: str) -> str:
@@ -114,10 +116,9 @@ class ShowdownClient:
         logging.info("Sending login request with name=%s to %s", username, login_url)
         async with httpx.AsyncClient() as client:
             response = await client.post(login_url, data=form_data)
-            response_text = response.text
-            if response_text.startswith("]"):
-                response_text = response_text[1:]
-            response_json = json.loads(response_text)
+            # The login server prefixes its JSON with "]"; decode the raw bytes
+            # directly instead of going through response.text first
+            response_json = msgspec.json.decode(response.content.removeprefix(b"]"))
             if "assertion" not in response_json:
                 error_msg = response_json.get("actionsuccess") or response_json
                 raise ValueError(f"Login failed: {error_msg}")
@@ -1,19 +1,45 @@
 """Battle state representation for battle simulation."""
 
-import json
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+import msgspec
+
 from python.game.interface.battle_action import ActionType, BattleAction
-from python.game.schema.enums import Stat
+from python.game.schema.enums import FieldEffect, SideCondition, Stat, Terrain, Weather
 from python.game.schema.field_state import FieldState
 from python.game.schema.object_name_normalizer import normalize_name
 from python.game.schema.pokemon_state import PokemonState
 from python.game.schema.team_state import TeamState
 
+# Enum member -> value tables, so get_field_info does a dict lookup per entry
+# instead of going through the Enum.value descriptor
+_WEATHER_VALUES = {member: member.value for member in Weather}
+_TERRAIN_VALUES = {member: member.value for member in Terrain}
+_FIELD_EFFECT_VALUES = {member: member.value for member in FieldEffect}
+_SIDE_CONDITION_VALUES = {member: member.value for member in SideCondition}
+
+_CHOICE_ITEMS = frozenset({"choicescarf", "choicespecs", "choiceband"})
+
+# Same key order as json.dumps(sort_keys=True), encoded in C
+_encode_sorted_json = msgspec.json.Encoder(order="sorted").encode
+
+
+class _SerializationCache:
+    """Slots for BattleState's memoized to_dict/str results.
+
+    States are never mutated in place (transitions build new ones via
+    dataclasses.replace), so serialized forms are computed at most once. The
+    slots live on this base rather than as fields so they stay out of eq, repr
+    and dataclasses.asdict. They are unset on copies and unpickled states,
+    hence the getattr defaults where they are read.
+    """
+
+    __slots__ = ("_dict_cache", "_str_cache")
+
 
-@dataclass(frozen=True)
-class BattleState:
+@dataclass(frozen=True, slots=True)
+class BattleState(_SerializationCache):
     """Immutable state of an entire battle.
 
     This is the complete snapshot of a battle, including both teams and field state.
@@ -55,9 +81,10 @@ class BattleState:
         Returns:
             TeamState for the specified player
         """
-        if player not in self.teams:
+        team = self.teams.get(player)
+        if team is None:
             raise ValueError(f"Invalid player ID: {player}")
-        return self.teams[player]
+        return team
 
     def get_active_pokemon(self, player: str) -> Optional[PokemonState]:
         """Get active Pokemon for a player.
@@ -103,37 +130,40 @@ class BattleState:
         ):
             return []
 
+        volatile_conditions = active.volatile_conditions
+        moves = active.moves
+
         # Check for Encore - only the encored move is available
-        if "encore" in active.volatile_conditions:
-            encore_data = active.volatile_conditions["encore"]
+        encore_data = volatile_conditions.get("encore")
+        if encore_data is not None:
             # Handle both {'move': 'MoveName'} and 'MoveName' formats
             encored_move = (
                 encore_data.get("move")
                 if isinstance(encore_data, dict)
                 else encore_data
             )
-            for move in active.moves:
+            for move in moves:
                 if move.name == encored_move and move.current_pp > 0:
                     return [move.name]
             return []
 
         # Check for Choice item locking - if Pokemon has Choice item and used a move,
         # only that move is available (others will have 0 PP or be tracked as locked)
-        choice_items = ["choicescarf", "choicespecs", "choiceband"]
-        pokemon_item = active.item.lower() if active.item else ""
-        has_choice_item = pokemon_item in choice_items
-
-        if has_choice_item and "choice_locked_move" in active.volatile_conditions:
-            locked_move = active.volatile_conditions["choice_locked_move"]
-            for move in active.moves:
+        locked_move = volatile_conditions.get("choice_locked_move")
+        if (
+            locked_move is not None
+            and active.item
+            and active.item.lower() in _CHOICE_ITEMS
+        ):
+            for move in moves:
                 if move.name == locked_move and move.current_pp > 0:
                     return [move.name]
             return []
 
         # Check for Disable - exclude the disabled move
         disabled_move = None
-        if "disable" in active.volatile_conditions:
-            disable_data = active.volatile_conditions["disable"]
+        disable_data = volatile_conditions.get("disable")
+        if disable_data is not None:
             disabled_move = (
                 disable_data.get("move")
                 if isinstance(disable_data, dict)
@@ -142,13 +172,13 @@ class BattleState:
 
         # Check for Gigaton Hammer restriction - cannot use twice in a row
         # Track the last move used to detect this restriction
-        last_move_used = active.volatile_conditions.get("last_move_used")
+        last_move_used = volatile_conditions.get("last_move_used")
         gigaton_hammer_disabled = (
             last_move_used and normalize_name(last_move_used) == "gigatonhammer"
         )
 
         available = []
-        for move in active.moves:
+        for move in moves:
             # Skip moves with no PP
             if move.current_pp <= 0:
                 continue
@@ -158,7 +188,7 @@ class BattleState:
                 continue
 
             # Skip Gigaton Hammer if it was just used
-            if gigaton_hammer_disabled and normalize_name(move.name) == "gigatonhammer":
+            if gigaton_hammer_disabled and move.normalized_name == "gigatonhammer":
                 continue
 
             available.append(move.name)
@@ -379,8 +409,7 @@ class BattleState:
         normalized_search = normalize_name(move_name)
 
         for i, move in enumerate(active_pokemon.moves):
-            normalized_move = normalize_name(move.name)
-            if normalized_move == normalized_search:
+            if move.normalized_name == normalized_search:
                 return i
 
         raise ValueError(
@@ -452,25 +481,23 @@ class BattleState:
             >>> len(info["p1_team"])
             6
         """
+        field_state = self.field_state
         result: Dict[str, Any] = {
-            "turn_number": self.field_state.turn_number,
-            "weather": (
-                self.field_state.weather.value if self.field_state.weather else None
-            ),
-            "weather_turns_remaining": self.field_state.weather_turns_remaining,
-            "terrain": (
-                self.field_state.terrain.value if self.field_state.terrain else None
-            ),
-            "terrain_turns_remaining": self.field_state.terrain_turns_remaining,
+            "turn_number": field_state.turn_number,
+            "weather": _WEATHER_VALUES.get(field_state.weather),
+            "weather_turns_remaining": field_state.weather_turns_remaining,
+            "terrain": _TERRAIN_VALUES.get(field_state.terrain),
+            "terrain_turns_remaining": field_state.terrain_turns_remaining,
             "field_effects": [
-                effect.value for effect in self.field_state.field_effects
+                _FIELD_EFFECT_VALUES[effect] for effect in field_state.field_effects
             ],
         }
 
         # Add side conditions and teams for each player
         for player_id, team in self.teams.items():
             result[f"{player_id}_side_conditions"] = {
-                cond.value: value for cond, value in team.side_conditions.items()
+                _SIDE_CONDITION_VALUES[cond]: value
+                for cond, value in team.side_conditions.items()
             }
             result[f"{player_id}_team"] = [p.to_dict() for p in team.get_pokemon_team()]
 
@@ -480,8 +507,13 @@ class BattleState:
         """Convert Battle state to dictionary for JSON serialization.
 
         Returns:
-            Dictionary representation of the entire battle state
+            Dictionary representation of the entire battle state. The same
+            dictionary is returned on every call, so callers must not mutate it.
         """
+        cached = getattr(self, "_dict_cache", None)
+        if cached is not None:
+            return cached
+
         result = {
             "battle_format": self.battle_format,
             "ruleset": self.ruleset,
@@ -499,7 +531,12 @@ class BattleState:
         for player_id, team in self.teams.items():
             result[f"{player_id}_team"] = team.to_dict()
 
+        object.__setattr__(self, "_dict_cache", result)
         return result
 
     def __str__(self) -> str:
-        return json.dumps(self.to_dict(), sort_keys=True)
+        cached = getattr(self, "_str_cache", None)
+        if cached is None:
+            cached = _encode_sorted_json(self.to_dict()).decode()
+            object.__setattr__(self, "_str_cache", cached)
+        return cached
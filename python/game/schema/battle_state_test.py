@@ -1,7 +1,9 @@
 """Integration tests for BattleState based on real battle logs."""
 
+import copy
 import json
 import unittest
+from dataclasses import asdict, replace
 
 from python.game.interface.battle_action import ActionType
 from python.game.schema.battle_state import BattleState
@@ -765,6 +767,36 @@ class BattleStateTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(parsed["battle_format"], "singles")
         self.assertEqual(parsed["field_state"]["turn_number"], 1)
         self.assertIn("stealthrock", parsed["p1_team"]["side_conditions"])
+        self.assertEqual(parsed, json.loads(json.dumps(battle.to_dict())))
+        self.assertEqual(list(parsed), sorted(parsed))
+
+    def test_get_team_rejects_unknown_player(self) -> None:
+        """Test that get_team raises for a player ID with no team."""
+        state = BattleState()
+
+        self.assertIs(state.get_team("p2"), state.teams["p2"])
+        with self.assertRaises(ValueError) as cm:
+            state.get_team("p3")
+
+        self.assertIn("Invalid player ID: p3", str(cm.exception))
+
+    def test_serialization_is_cached_per_state(self) -> None:
+        """Test that to_dict and str are computed once per state instance."""
+        battle = BattleState(field_state=FieldState(turn_number=3))
+
+        self.assertIs(battle.to_dict(), battle.to_dict())
+        self.assertIs(str(battle), str(battle))
+        self.assertNotIn("_dict_cache", asdict(battle))
+
+        next_battle = replace(battle, field_state=FieldState(turn_number=4))
+        self.assertEqual(next_battle.to_dict()["field_state"]["turn_number"], 4)
+        self.assertEqual(json.loads(str(next_battle))["field_state"]["turn_number"], 4)
+        self.assertEqual(battle, BattleState(field_state=FieldState(turn_number=3)))
+        self.assertEqual(json.loads(str(copy.copy(battle))), json.loads(str(battle)))
+
+    def test_battle_state_has_no_instance_dict(self) -> None:
+        """Test that BattleState stores its fields in slots."""
+        self.assertFalse(hasattr(BattleState(), "__dict__"))
 
     def test_opponent_potential_actions_no_revealed_moves(self) -> None:
         """Test opponent actions when no moves are revealed yet."""
@@ -1,3 +1,11 @@
+import functools
+import re
+
+# \W with "_" matches exactly the characters for which str.isalnum() is False.
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize Pokemon object names to match Pokemon Showdown's toID function.
 
@@ -7,6 +15,9 @@ def normalize_name(name: str) -> str:
     Matches Pokemon Showdown's toID() implementation:
     text.toLowerCase().replace(/[^a-z0-9]+/g, '')
 
+    Results are memoized since the same species and move names are normalized
+    repeatedly over the course of a battle.
+
     Args:
         name: The name to normalize (e.g., "Farfetch'd", "Will-O-Wisp", "Mr. Mime")
 
@@ -23,4 +34,7 @@ def normalize_name(name: str) -> str:
         >>> normalize_name("Nidoran♀")
         'nidoran'
     """
-    return "".join(c for c in name.lower() if c.isalnum())
+    lowered = name.lower()
+    if lowered.isalnum():
+        return lowered
+    return _NON_ALNUM_RE.sub("", lowered)
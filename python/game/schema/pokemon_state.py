@@ -1,10 +1,12 @@
 """Pokemon state representation for battle simulation."""
 
+import functools
 import json
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from python.game.schema.enums import Stat, Status
+from python.game.schema.object_name_normalizer import normalize_name
 
 
 # Stat stage multipliers for stages -6 to +6
@@ -33,6 +35,11 @@ class PokemonMove:
     current_pp: int
     max_pp: int
 
+    @functools.cached_property
+    def normalized_name(self) -> str:
+        """Move name as a Showdown ID, computed once per move instance."""
+        return normalize_name(self.name)
+
 
 @dataclass(frozen=True)
 class PokemonState:
@@ -2,10 +2,12 @@
 
 import json
 import unittest
+from dataclasses import asdict
 
 from python.game.schema.enums import Stat, Status
 from python.game.schema.pokemon_state import (
     STAT_STAGE_MULTIPLIERS,
+    PokemonMove,
     PokemonState,
 )
 
@@ -216,6 +218,18 @@ class PokemonStateTest(unittest.IsolatedAsyncioTestCase):
         self.assertAlmostEqual(tinkaton_stats["hp"]["percentage"], 5.36, places=2)
         self.assertEqual(landorus_stats["hp"]["percentage"], 88.0)
 
+    def test_move_normalized_name(self) -> None:
+        """Test that moves expose their Showdown ID without changing equality."""
+        move = PokemonMove(name="Will-O-Wisp", current_pp=24, max_pp=24)
+
+        self.assertEqual(move.normalized_name, "willowisp")
+        self.assertEqual(
+            move, PokemonMove(name="Will-O-Wisp", current_pp=24, max_pp=24)
+        )
+        self.assertEqual(
+            asdict(move), {"name": "Will-O-Wisp", "current_pp": 24, "max_pp": 24}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()